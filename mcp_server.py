@@ -7,16 +7,35 @@ A Model Context Protocol server for Google Ads API operations
 from __future__ import annotations
 
 import asyncio
+import atexit
+import copy
 import json
 import sys
 import os
-from typing import Any, Dict, List, Optional
-import requests
+import pickle
+import queue
+import re
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import aiohttp
+import orjson
 from pathlib import Path
 from datetime import datetime, timedelta
+from dataclasses import dataclass
+from collections import Counter, OrderedDict, defaultdict, deque
 import hashlib
+import heapq
+import inspect
+from itertools import islice
 from dotenv import load_dotenv
 
+try:
+    import ahocorasick  # Optional: faster operation matching in execute_any_operation
+except ImportError:
+    ahocorasick = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -35,8 +54,145 @@ GOOGLE_ADS_ORG_ID = os.getenv("GOOGLE_ADS_ORG_ID", "f76a9096-db82-4506-b451-6147
 GOOGLE_ADS_LINKED_ACCOUNT_ID = os.getenv("GOOGLE_ADS_LINKED_ACCOUNT_ID", "e9c9e1ea-cf54-4011-9785-fde0cd32d05f")
 ROOT_MCC = os.getenv("GOOGLE_ADS_MCC_ID", "1639353427")  # Top-level manager customer ID
 
-# API Success Logging
-API_LOG_FILE = Path(__file__).parent / "api_success_log.json"
+# Shared HTTP session: keeps TLS connections to the proxy alive between calls.
+# Retries only apply to idempotent methods, so mutations are never replayed.
+HTTP_METHODS_WITH_BODY = ("POST", "PUT")
+HTTP_IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+HTTP_METHODS = ("GET", "DELETE") + HTTP_METHODS_WITH_BODY
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.3
+HTTP_MAX_CONNECTIONS = 100  # Every request goes to the one proxy host
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=3.05, sock_read=30)
+HTTP_STATIC_HEADERS = MappingProxyType({
+    "Content-Type": "application/json",
+    "x-org-id": GOOGLE_ADS_ORG_ID,
+    "x-linked-account-id": GOOGLE_ADS_LINKED_ACCOUNT_ID,
+    "Accept": "*/*"
+})
+
+class _TTLCache:
+    """Small LRU cache whose entries expire a fixed number of seconds after being set (never if ttl is None)"""
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+    
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expiry, value = item
+        if expiry < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key, value):
+        expiry = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        self._data[key] = (expiry, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def clear(self):
+        self._data.clear()
+    
+    def discard_where(self, predicate):
+        """Drop every entry whose key satisfies predicate"""
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+
+_CUSTOMER_ID_RE = re.compile(r"customers/(\d+)")
+
+# Successful GET responses keyed by (url, login_customer_id); cleared on any mutation
+_GET_CACHE = _TTLCache(maxsize=512, ttl=60)
+
+_HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it inside the running loop"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        _HTTP_SESSION = aiohttp.ClientSession(
+            headers=HTTP_STATIC_HEADERS,
+            connector=aiohttp.TCPConnector(limit=HTTP_MAX_CONNECTIONS, limit_per_host=HTTP_MAX_CONNECTIONS),
+            timeout=HTTP_TIMEOUT
+        )
+    return _HTTP_SESSION
+
+async def close_http_session():
+    """Close the shared aiohttp session"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        await _HTTP_SESSION.close()
+    _HTTP_SESSION = None
+
+# API Success Logging (one JSON entry per line, appended on every success)
+API_LOG_FILE = Path(__file__).parent / "api_success_log.jsonl"
+API_LOG_MAX_ENTRIES = 1000  # Entries kept when the log is compacted
+API_LOG_COMPACT_EVERY = 256  # Appends between compactions
+API_LOG_BATCH_INTERVAL = 0.1  # Seconds the writer thread waits to batch queued entries
+API_LOG_BATCH_MAX = 256  # Entries written per batch at most
+API_LOG_DATA_MAX_CHARS = 256  # Larger request payloads are logged as a hash + preview
+API_LOG_DERIVABLE_KEYS = ("url", "headers_used")  # Context keys no longer logged per entry
+CONTEXT_FLUSH_EVERY = 50  # Context updates before a forced flush to disk
+CONTEXT_FLUSH_INTERVAL = 5.0  # Seconds before pending context updates are flushed
+WORKING_EXAMPLES_MAX = 10  # Working examples kept per operation type
+COMMON_PARAMETER_VALUES_MAX = 32  # Distinct values kept per tracked parameter
+COMMON_PARAMETERS_TRIM_EVERY = 100  # Learned operations between parameter trims
+RECENT_SUCCESSES_MAX = 500  # Successful queries kept in memory for get_patterns
+RECENT_SUCCESSES_PER_CUSTOMER = 10  # Successful queries kept in memory per customer
+PATTERNS_MAX = 50  # Successful queries returned by get_patterns
+
+_ISO_NOW_CACHE: tuple[int, str] = (0, "")  # (epoch second, its ISO string)
+
+def _iso_now() -> str:
+    """Current local time as an ISO string, formatted at most once per second"""
+    global _ISO_NOW_CACHE
+    now = int(time.time())
+    second, text = _ISO_NOW_CACHE
+    if now != second:
+        text = datetime.fromtimestamp(now).isoformat()
+        _ISO_NOW_CACHE = (now, text)
+    return text
+
+def _json_default(obj):
+    """Serialize bounded containers as lists, frozen mappings as dicts and anything else as a string"""
+    if isinstance(obj, deque):
+        return list(obj)
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    return str(obj)
+
+def _freeze(obj: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+def _summarize_payload(data: Any) -> Any:
+    """Return a request payload small enough to log: as-is, or a fingerprint and preview"""
+    encoded = orjson.dumps(data, default=_json_default)
+    if len(encoded) <= API_LOG_DATA_MAX_CHARS:
+        return data
+    return {
+        "data_hash": hashlib.blake2b(encoded, digest_size=4).hexdigest(),
+        "data_preview": encoded[:API_LOG_DATA_MAX_CHARS].decode("utf-8", errors="ignore"),
+        "data_size": len(encoded)
+    }
+
+@dataclass(slots=True, frozen=True)
+class RecentSuccess:
+    """Summary of one logged success, kept in the logger's in-memory recent buffers"""
+    query: str
+    customer_id: str
+    result_count: int
+    operation: str
 
 class APISuccessLogger:
     """Enhanced learning system that captures ALL successful operations and builds smart context"""
@@ -44,14 +200,62 @@ class APISuccessLogger:
     def __init__(self):
         self.log_file = API_LOG_FILE
         self.context_file = Path(__file__).parent / "ai_learning_context.json"
+        self._append_count = 0
+        self._log_lock = threading.Lock()
         self._ensure_log_file()
+        self._migrate_log()
         self._ensure_context_file()
+        
+        # Learning context lives in memory and is flushed to disk in the background
+        self._context_lock = threading.RLock()
+        self._context = self._load_context()
+        self._ctx_dirty = 0
+        self._ctx_version = 0  # Bumped on every context change; part of the read cache keys
+        self._read_cache = _TTLCache(maxsize=128)
+        self._learn_count = 0
+        self._flush_timer = None
+        
+        # Recent successes, newest last, so pattern reads never touch the log file
+        self._recent_lock = threading.Lock()
+        self._recent: deque = deque(maxlen=RECENT_SUCCESSES_MAX)
+        self._recent_by_customer: defaultdict = defaultdict(lambda: deque(maxlen=RECENT_SUCCESSES_PER_CUSTOMER))
+        self._remember(self._tail(RECENT_SUCCESSES_MAX))
+        
+        # Successes are queued and written/learned from by a background thread
+        self._log_queue: queue.Queue = queue.Queue()
+        self._log_thread = threading.Thread(target=self._drain_log_queue, name="api-success-log", daemon=True)
+        self._log_thread.start()
+        atexit.register(self._shutdown)
     
     def _ensure_log_file(self):
         """Create log file if it doesn't exist"""
         if not self.log_file.exists():
             self._save_log([])
     
+    def _migrate_log(self):
+        """One-time pass that strips derivable context keys from older log entries"""
+        try:
+            with open(self.log_file, 'rb') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        if not any(b'"headers_used"' in line for line in lines):
+            return
+        
+        migrated = []
+        for line in lines:
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            context = entry.get("context") or {}
+            for key in API_LOG_DERIVABLE_KEYS:
+                context.pop(key, None)
+            if context.get("data") is None:
+                context.pop("data", None)
+            migrated.append(entry)
+        self._save_log(migrated)
+    
     def _ensure_context_file(self):
         """Create AI context file if it doesn't exist"""
         if not self.context_file.exists():
@@ -65,24 +269,72 @@ class APISuccessLogger:
             })
     
     def _load_log(self) -> List[Dict]:
-        """Load existing log entries"""
+        """Load the most recent log entries"""
+        return self._tail(API_LOG_MAX_ENTRIES)
+    
+    def _tail(self, n: int, operation_type: str = None) -> List[Dict]:
+        """Load the last n log entries, optionally only those of one operation type"""
         try:
-            with open(self.log_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(self.log_file, 'rb') as f:
+                lines = deque(f, maxlen=API_LOG_MAX_ENTRIES if operation_type else n)
+        except FileNotFoundError:
             return []
+        
+        # Parse newest first so a filtered read stops as soon as it has n matches
+        entries = []
+        for line in reversed(lines):
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue  # Skip blank or partially written lines
+            if operation_type and entry.get("operation_type") != operation_type:
+                continue
+            entries.append(entry)
+            if len(entries) == n:
+                break
+        entries.reverse()
+        return entries
     
     def _save_log(self, entries: List[Dict]):
-        """Save log entries to file"""
-        with open(self.log_file, 'w') as f:
-            json.dump(entries, f, indent=2, default=str)
+        """Atomically replace the log file with the given entries"""
+        self._write_log_lines(orjson.dumps(entry, default=_json_default) + b"\n" for entry in entries)
+    
+    def _write_log_lines(self, lines):
+        """Write lines to a temp file and rename it over the log file"""
+        tmp_file = self.log_file.with_name(self.log_file.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            f.writelines(lines)
+        os.replace(tmp_file, self.log_file)
+    
+    def _append_log(self, entries: List[Dict]):
+        """Append entries to the log in one write, compacting it periodically"""
+        data = b"".join(orjson.dumps(entry, default=_json_default) + b"\n" for entry in entries)
+        with self._log_lock:
+            with open(self.log_file, 'ab', buffering=1 << 16) as f:
+                f.write(data)
+            
+            self._append_count += len(entries)
+            if self._append_count >= API_LOG_COMPACT_EVERY:
+                self._append_count = 0
+                self._compact_log()
+    
+    def _compact_log(self):
+        """Trim the log file to the last API_LOG_MAX_ENTRIES lines"""
+        try:
+            with open(self.log_file, 'rb') as f:
+                lines = deque(f, maxlen=API_LOG_MAX_ENTRIES)
+        except FileNotFoundError:
+            return
+        self._write_log_lines(lines)
     
     def _load_context(self) -> Dict:
         """Load AI learning context"""
         try:
-            with open(self.context_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+            context = orjson.loads(self.context_file.read_bytes())
+            for pattern in context.get("learned_patterns", {}).values():
+                pattern["working_examples"] = deque(pattern.get("working_examples", []), maxlen=WORKING_EXAMPLES_MAX)
+            return context
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return {
                 "learned_patterns": {},
                 "successful_workflows": {},
@@ -94,41 +346,118 @@ class APISuccessLogger:
     
     def _save_context(self, context: Dict):
         """Save AI learning context"""
-        context["last_updated"] = datetime.now().isoformat()
-        with open(self.context_file, 'w') as f:
-            json.dump(context, f, indent=2, default=str)
+        context["last_updated"] = _iso_now()
+        self.context_file.write_bytes(
+            orjson.dumps(context, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=_json_default)
+        )
+    
+    def _mark_context_dirty(self):
+        """Record an in-memory context update and schedule a flush"""
+        with self._context_lock:
+            self._ctx_dirty += 1
+            if self._ctx_dirty >= CONTEXT_FLUSH_EVERY:
+                self._flush_context()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(CONTEXT_FLUSH_INTERVAL, self._flush_context)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush_context(self):
+        """Write pending context updates to disk"""
+        with self._context_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._ctx_dirty:
+                return
+            self._ctx_dirty = 0
+            self._save_context(self._context)
+            self._ctx_version += 1  # last_updated changed
+    
+    def _drain_log_queue(self):
+        """Background loop: write queued entries in batches, then learn from them"""
+        while True:
+            entry = self._log_queue.get()
+            if entry is None:
+                return
+            time.sleep(API_LOG_BATCH_INTERVAL)
+            
+            batch = [entry]
+            stop = False
+            while len(batch) < API_LOG_BATCH_MAX:
+                try:
+                    entry = self._log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stop = True
+                    break
+                batch.append(entry)
+            
+            self._process_batch(batch)
+            if stop:
+                return
+    
+    def _remember(self, entries: List[Dict]):
+        """Add log entries to the in-memory recent-success buffers"""
+        with self._recent_lock:
+            for entry in entries:
+                summary = RecentSuccess(entry["query"], entry["customer_id"], entry["result_count"], entry["operation_type"])
+                self._recent.append(summary)
+                self._recent_by_customer[entry["customer_id"]].append(summary)
+    
+    def _process_batch(self, batch: List[Dict]):
+        """Persist a batch of successes and fold them into the learning context"""
+        try:
+            self._append_log(batch)
+            self._remember(batch)
+            for entry in batch:
+                self._learn_from_success(entry)
+        except Exception as e:
+            print(f"Error writing API success log: {e}", file=sys.stderr)
+    
+    def _shutdown(self):
+        """Write any queued entries and pending context updates before exit"""
+        self._log_queue.put(None)
+        self._log_thread.join(timeout=5)
+        self._flush_context()
     
     def log_success(self, operation_type: str, customer_id: str, query: str, 
                    result_count: int, context: Dict = None):
-        """Log a successful API call and learn from it"""
+        """Queue a successful API call to be logged and learned from in the background"""
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),  # orjson writes the ISO string when the entry is saved
             "operation_type": operation_type,
             "customer_id": customer_id,
             "query": query,
-            "query_hash": hashlib.md5(query.encode()).hexdigest()[:8],
+            "query_hash": hashlib.blake2b(query.encode(), digest_size=4).hexdigest(),
             "result_count": result_count,
             "context": context or {},
             "success": True
         }
         
-        # Save to log
-        entries = self._load_log()
-        entries.append(entry)
-        
-        # Keep only last 1000 entries
-        if len(entries) > 1000:
-            entries = entries[-1000:]
-        
-        self._save_log(entries)
-        
-        # Learn from this success
-        self._learn_from_success(entry)
+        # Written to the log and learned from by the background thread
+        self._log_queue.put_nowait(entry)
     
     def _learn_from_success(self, entry: Dict):
         """Extract learnings from successful operation"""
-        ai_context = self._load_context()
-        
+        with self._context_lock:
+            self._update_context(self._context, entry)
+            self._ctx_version += 1
+            self._learn_count += 1
+            if self._learn_count % COMMON_PARAMETERS_TRIM_EVERY == 0:
+                self._trim_common_parameters(self._context)
+        self._mark_context_dirty()
+    
+    def _trim_common_parameters(self, ai_context: Dict):
+        """Keep only the most frequent values for each tracked parameter"""
+        for pattern in ai_context["learned_patterns"].values():
+            for key, values in pattern["common_parameters"].items():
+                if len(values) > COMMON_PARAMETER_VALUES_MAX:
+                    pattern["common_parameters"][key] = dict(Counter(values).most_common(COMMON_PARAMETER_VALUES_MAX))
+    
+    def _update_context(self, ai_context: Dict, entry: Dict):
+        """Apply a successful operation to the learning context in place"""
         operation_type = entry["operation_type"]
         customer_id = entry["customer_id"]
         context_data = entry.get("context", {})
@@ -138,7 +467,7 @@ class APISuccessLogger:
             ai_context["learned_patterns"][operation_type] = {
                 "success_count": 0,
                 "common_parameters": {},
-                "working_examples": [],
+                "working_examples": deque(maxlen=WORKING_EXAMPLES_MAX),
                 "best_practices": []
             }
         
@@ -155,7 +484,7 @@ class APISuccessLogger:
                 pattern["common_parameters"][key][value_str] = 0
             pattern["common_parameters"][key][value_str] += 1
         
-        # Keep best working examples
+        # Keep best working examples (the deque drops the oldest beyond 10)
         pattern["working_examples"].append({
             "query": entry["query"],
             "context": context_data,
@@ -163,10 +492,6 @@ class APISuccessLogger:
             "timestamp": entry["timestamp"]
         })
         
-        # Keep only last 10 examples per operation type
-        if len(pattern["working_examples"]) > 10:
-            pattern["working_examples"] = pattern["working_examples"][-10:]
-        
         # Learn customer preferences
         if customer_id not in ai_context["customer_preferences"]:
             ai_context["customer_preferences"][customer_id] = {
@@ -189,42 +514,60 @@ class APISuccessLogger:
                 if bidding_strategy not in ai_context["optimal_configurations"]["campaign_bidding"]:
                     ai_context["optimal_configurations"]["campaign_bidding"][bidding_strategy] = 0
                 ai_context["optimal_configurations"]["campaign_bidding"][bidding_strategy] += 1
-        
-        # Save updated context
-        self._save_context(ai_context)
     
     def get_patterns(self, operation_type: str = None) -> Dict:
         """Get successful patterns for AI context"""
-        entries = self._load_log()
-        
-        if operation_type:
-            entries = [e for e in entries if e.get("operation_type") == operation_type]
+        with self._recent_lock:
+            recent = (q for q in reversed(self._recent) if not operation_type or q.operation == operation_type)
+            successful_queries = list(islice(recent, PATTERNS_MAX))  # Last 50 successful calls
+        successful_queries.reverse()
         
         # Group by common patterns
         patterns = {
-            "successful_queries": [],
+            "successful_queries": successful_queries,
             "common_fields": {},
-            "working_customer_ids": set(),
+            # Unique customer IDs in first-seen order, for stable prompts
+            "working_customer_ids": list(dict.fromkeys(q.customer_id for q in successful_queries)),
             "query_templates": []
         }
         
-        for entry in entries[-50:]:  # Last 50 successful calls
-            patterns["successful_queries"].append({
-                "query": entry["query"],
-                "customer_id": entry["customer_id"],
-                "result_count": entry["result_count"],
-                "operation": entry["operation_type"]
-            })
-            patterns["working_customer_ids"].add(entry["customer_id"])
-        
-        patterns["working_customer_ids"] = list(patterns["working_customer_ids"])
-        
         return patterns
     
     def get_ai_context(self, customer_id: str = None, operation_type: str = None) -> Dict:
         """Get comprehensive AI context for smart recommendations"""
-        ai_context = self._load_context()
-        
+        return self._cached_read("ai_context", self._build_ai_context, customer_id, operation_type)
+    
+    def get_recent_successful(self, n: int = 3, customer_id: str = None, operation_type: str = None) -> List[RecentSuccess]:
+        """The last n queries that returned results, oldest first, optionally for one customer/operation"""
+        with self._recent_lock:
+            recent = self._recent_by_customer.get(customer_id, ()) if customer_id else self._recent
+            matches = (
+                q for q in reversed(recent)
+                if q.result_count > 0 and (not operation_type or q.operation == operation_type)
+            )
+            queries = list(islice(matches, n))
+        queries.reverse()
+        return queries
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever a new success is learned from"""
+        return self._ctx_version
+    
+    def _cached_read(self, kind: str, build, *args) -> Dict:
+        """Memoize a context-derived read until the context next changes"""
+        with self._context_lock:
+            key = (kind, *args, self._ctx_version)
+            result = self._read_cache.get(key)
+            if result is None:
+                # Builders slice the live context, which the background learner keeps mutating;
+                # a deep copy keeps the cached result fixed at this version
+                result = copy.deepcopy(build(self._context, *args))
+                self._read_cache.set(key, result)
+            return result
+    
+    def _build_ai_context(self, ai_context: Dict, customer_id: str, operation_type: str) -> Dict:
+        """Slice the learning context for one customer and operation type"""
         # Filter context if specific customer or operation requested
         if customer_id and customer_id in ai_context["customer_preferences"]:
             customer_context = ai_context["customer_preferences"][customer_id]
@@ -246,7 +589,10 @@ class APISuccessLogger:
     
     def suggest_optimal_settings(self, operation_type: str, customer_id: str = None) -> Dict:
         """Suggest optimal settings based on learned patterns"""
-        ai_context = self._load_context()
+        return self._cached_read("suggestions", self._build_suggestions, operation_type, customer_id)
+    
+    def _build_suggestions(self, ai_context: Dict, operation_type: str, customer_id: str) -> Dict:
+        """Derive suggested settings from the learning context"""
         
         suggestions = {
             "recommended_settings": {},
@@ -278,8 +624,29 @@ class APISuccessLogger:
 # Global logger instance
 api_logger = APISuccessLogger()
 
+TOKEN_CACHE_TTL = 300  # Seconds an access token is reused before re-reading it
+_TOKEN_CACHE: tuple[Optional[str], float] = (None, 0.0)  # (token, monotonic expiry)
+
 def get_access_token() -> Optional[str]:
     """Get access token from environment variable (permanent) or CLI session file (fallback)"""
+    global _TOKEN_CACHE
+    token, expiry = _TOKEN_CACHE
+    now = time.monotonic()
+    if token and now < expiry:
+        return token
+    
+    token = _read_access_token()
+    if token:
+        _TOKEN_CACHE = (token, now + TOKEN_CACHE_TTL)
+    return token
+
+def _invalidate_token():
+    """Drop the cached access token so the next request re-reads it"""
+    global _TOKEN_CACHE
+    _TOKEN_CACHE = (None, 0.0)
+
+def _read_access_token() -> Optional[str]:
+    """Read the access token from the environment or the CLI session file"""
     try:
         # First, try permanent JWT token from environment
         permanent_token = os.getenv('PERMANENT_JWT_TOKEN')
@@ -297,636 +664,959 @@ def get_access_token() -> Optional[str]:
         print(f"Error reading authentication: {e}", file=sys.stderr)
         return None
 
-def make_google_ads_request(endpoint: str, data: dict = None, method: str = "POST", login_customer_id: Optional[str] = None, operation_type: str = "custom_api_call") -> dict:
-    """Make a request to the Google Ads proxy API with optional login customer ID and automatic learning"""
+async def make_google_ads_request(endpoint: str, data: dict = None, method: str = "POST", login_customer_id: Optional[str] = None, operation_type: str = "custom_api_call", use_cache: bool = True) -> dict:
+    """Make a request to the Google Ads proxy API with optional login customer ID and automatic learning
+    
+    Successful GET responses are cached for a minute; pass use_cache=False to bypass the cache.
+    Failed HTTP responses carry their status code in http_status.
+    """
     access_token = get_access_token()
     if not access_token:
         return {"error": "No access token available. Please run 'aio-cli auth login' first."}
     
     url = f"{GOOGLE_ADS_PROXY_URL}/p/{GOOGLE_ADS_API_VERSION}/{endpoint}"
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-        "x-org-id": GOOGLE_ADS_ORG_ID,
-        "x-linked-account-id": GOOGLE_ADS_LINKED_ACCOUNT_ID,
-        "Accept": "*/*"
-    }
+    method = method.upper()
+    if method not in HTTP_METHODS:
+        return {"error": f"Unsupported HTTP method: {method}"}
+    
+    cache_key = (url, login_customer_id)
+    if method == "GET" and use_cache:
+        cached = _GET_CACHE.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+    
+    # Static headers live on the shared session; only per-call ones are set here
+    headers = {"Authorization": f"Bearer {access_token}"}
     
     # Add login customer ID if provided
     if login_customer_id:
         headers["login-customer-id"] = login_customer_id
     
+    # Encode the body once with orjson rather than per attempt with aiohttp's stdlib json
+    payload = None
+    if data is not None and method in HTTP_METHODS_WITH_BODY:
+        payload = orjson.dumps(data, default=_json_default)
+    
     try:
-        if method.upper() == "GET":
-            response = requests.get(url, headers=headers)
-        elif method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=data)
-        elif method.upper() == "PUT":
-            response = requests.put(url, headers=headers, json=data)
-        elif method.upper() == "DELETE":
-            response = requests.delete(url, headers=headers)
-        else:
-            return {"error": f"Unsupported HTTP method: {method}"}
-            
-        response.raise_for_status()
-        result = response.json()
+        session = _get_http_session()
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            async with session.request(
+                method,
+                url,
+                headers=headers,
+                data=payload
+            ) as response:
+                if (response.status in HTTP_RETRY_STATUSES and method in HTTP_IDEMPOTENT_METHODS
+                        and attempt < HTTP_MAX_RETRIES):
+                    await asyncio.sleep(HTTP_BACKOFF_FACTOR * (2 ** attempt))
+                    continue
+                response.raise_for_status()
+                body = await response.read()
+                break
+        
+        # Parse after the connection has gone back to the pool
+        result = orjson.loads(body)
+        
+        is_dict = isinstance(result, dict)
+        if is_dict and not result.get("error"):
+            if method == "GET":
+                _GET_CACHE.set(cache_key, dict(result))
+            elif (method in ("PUT", "DELETE") or ":mutate" in endpoint) and not (data or {}).get("validate_only"):
+                # A validate_only mutate changes nothing, so cached reads stay valid
+                _GET_CACHE.clear()
         
         # LEARN FROM EVERY SUCCESS - Extract customer ID from endpoint or data
-        customer_id = "unknown"
-        if "customers/" in endpoint:
-            try:
-                customer_id = endpoint.split("customers/")[1].split("/")[0]
-            except:
-                pass
+        match = _CUSTOMER_ID_RE.search(endpoint)
+        customer_id = match.group(1) if match else "unknown"
         
         # Log this successful custom API call for learning
-        if result and not result.get("error"):
-            result_count = 0
-            if "results" in result:
-                result_count = len(result["results"])
-            elif isinstance(result, list):
-                result_count = len(result)
+        if result and not (is_dict and result.get("error")):
+            if is_dict:
+                result_count = len(result["results"]) if "results" in result else 1
             else:
-                result_count = 1
+                # searchStream answers with a list of result batches
+                result_count = sum(len(batch.get("results", ())) if isinstance(batch, dict) else 1 for batch in result)
+            
+            # Capture what varies per call; url and static headers are derivable
+            log_context = {
+                "endpoint": endpoint,
+                "method": method,
+                "login_customer_id": login_customer_id,
+                "response_keys": list(result.keys()) if is_dict else []
+            }
+            if data is not None:
+                log_context["data"] = _summarize_payload(data)
             
-            # Capture EVERYTHING for learning
             api_logger.log_success(
                 operation_type=operation_type,
                 customer_id=customer_id,
                 query=f"{method} {endpoint}: {data}",
                 result_count=result_count,
-                context={
-                    "endpoint": endpoint,
-                    "method": method,
-                    "data": data,
-                    "login_customer_id": login_customer_id,
-                    "response_keys": list(result.keys()) if isinstance(result, dict) else [],
-                    "url": url,
-                    "headers_used": {k: v for k, v in headers.items() if k != "Authorization"}
-                }
+                context=log_context
             )
         
         return result
-    except requests.exceptions.RequestException as e:
-        return {"error": f"API request failed: {str(e)}"}
+    except (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+        error = {"error": f"API request failed: {str(e)}"}
+        if isinstance(e, aiohttp.ClientResponseError):
+            error["http_status"] = e.status  # Lets callers branch on the status without parsing the message
+            if e.status == 401:
+                _invalidate_token()
+        return error
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """List available Google Ads tools"""
-    return [
-        types.Tool(
-            name="search_campaigns",
-            description="Search for Google Ads campaigns",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results to return",
-                        "default": 10
-                    }
+# Campaign bidding fields per strategy, built from (target_cpa_micros, target_roas).
+# Some strategies reuse those two inputs for their own targets, as noted.
+_BIDDING_BUILDERS: dict[str, Callable[[Optional[int], Optional[float]], dict]] = {
+    "MAXIMIZE_CONVERSIONS": lambda cpa, roas: {
+        "maximize_conversions": {"target_cpa_micros": cpa} if cpa else {}
+    },
+    "MAXIMIZE_CONVERSION_VALUE": lambda cpa, roas: {
+        "maximize_conversion_value": {"target_roas": roas} if roas else {}
+    },
+    "MAXIMIZE_CLICKS": lambda cpa, roas: {
+        "maximize_clicks": {"target_spend_micros": cpa} if cpa else {}  # Daily budget cap for max clicks
+    },
+    "TARGET_CPA": lambda cpa, roas: {"target_cpa": {"target_cpa_micros": cpa or 50000000}},
+    "TARGET_ROAS": lambda cpa, roas: {"target_roas": {"target_roas": roas or 4.0}},
+    "TARGET_IMPRESSION_SHARE": lambda cpa, roas: {
+        "target_impression_share": {
+            "target_impression_share_micros": int((roas or 0.5) * 1000000),  # Use target_roas field for impression share %
+            "cpc_bid_ceiling_micros": cpa or 10000000,  # Max CPC bid
+            "location": "SEARCH_PAGE_TOP"  # Default to top of search page
+        }
+    },
+    "TARGET_CPM": lambda cpa, roas: {"target_cpm": {"target_cpm_micros": cpa or 5000000}},
+    "TARGET_SPEND": lambda cpa, roas: {"target_spend": {"target_spend_micros": cpa or 50000000}},
+    "MANUAL_CPC": lambda cpa, roas: {"manual_cpc": {}},
+    "MANUAL_CPM": lambda cpa, roas: {"manual_cpm": {}},
+    "MANUAL_CPV": lambda cpa, roas: {"manual_cpv": {}},
+    "COMMISSION": lambda cpa, roas: {"commission": {"commission_rate_micros": int((roas or 0.05) * 1000000)}},  # 5% default
+    "PERCENT_CPC": lambda cpa, roas: {"percent_cpc": {"cpc_bid_ceiling_micros": cpa or 10000000}},
+}
+
+# Tool definitions are static, so build them once at import
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="search_campaigns",
+        description="Search for Google Ads campaigns",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
                 },
-                "required": ["customer_id"]
-            }
-        ),
-        types.Tool(
-            name="run_gaql",
-            description="Execute a Google Ads Query Language (GAQL) query",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "query": {
-                        "type": "string",
-                        "description": "GAQL query to execute"
-                    },
-                    "parallel": {
-                        "type": "boolean",
-                        "description": "Whether to run query across all accessible customers",
-                        "default": False
-                    },
-                    "login_customer_id": {
-                        "type": "string",
-                        "description": "Manager customer ID for authentication (auto-set to ROOT_MCC if omitted)"
-                    }
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return",
+                    "default": 10
+                }
+            },
+            "required": ["customer_id"]
+        }
+    ),
+    types.Tool(
+        name="run_gaql",
+        description="Execute a Google Ads Query Language (GAQL) query",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
                 },
-                "required": ["customer_id", "query"]
-            }
-        ),
-        types.Tool(
-            name="get_account_info",
-            description="Get basic account information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    }
+                "query": {
+                    "type": "string",
+                    "description": "GAQL query to execute"
+                },
+                "parallel": {
+                    "type": "boolean",
+                    "description": "Whether to run query across all accessible customers",
+                    "default": False
+                },
+                "login_customer_id": {
+                    "type": "string",
+                    "description": "Manager customer ID for authentication (auto-set to ROOT_MCC if omitted)"
+                },
+                "stream": {
+                    "type": "boolean",
+                    "description": "Use searchStream instead of paged search (default: only when the query has no LIMIT or a large one)"
+                }
+            },
+            "required": ["customer_id", "query"]
+        }
+    ),
+    types.Tool(
+        name="get_account_info",
+        description="Get basic account information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                }
+            },
+            "required": ["customer_id"]
+        }
+    ),
+    types.Tool(
+        name="mutate_campaign",
+        description="Update campaign settings (e.g., ROAS targets, budgets)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "campaign_id": {
+                    "type": "string",
+                    "description": "Campaign ID to update"
                 },
-                "required": ["customer_id"]
+                "updates": {
+                    "type": "object",
+                    "description": "Campaign updates (e.g., target_roas, daily_budget_micros)"
+                }
+            },
+            "required": ["customer_id", "campaign_id", "updates"]
+        }
+    ),
+    types.Tool(
+        name="lookup_docs",
+        description="Search Google Ads API documentation for field names and query examples",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "resource": {
+                    "type": "string",
+                    "description": "Resource to look up (e.g., 'campaign', 'ad_group', 'GoogleAdsService')"
+                }
+            },
+            "required": ["resource"]
+        }
+    ),
+    types.Tool(
+        name="get_ai_context",
+        description="Get successful API patterns and examples for AI prompting context",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operation_type": {
+                    "type": "string",
+                    "description": "Filter by operation type (gaql_query, campaign_mutation, etc.)"
+                }
             }
-        ),
-        types.Tool(
-            name="mutate_campaign",
-            description="Update campaign settings (e.g., ROAS targets, budgets)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "campaign_id": {
-                        "type": "string",
-                        "description": "Campaign ID to update"
-                    },
-                    "updates": {
+        }
+    ),
+    types.Tool(
+        name="api_call",
+        description="Make any Google Ads API call - campaigns, ad groups, keywords, budgets, etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "endpoint": {
+                    "type": "string",
+                    "description": "API endpoint path (e.g., 'customers/{customer_id}/campaigns:mutate', 'customers/{customer_id}/campaignBudgets:mutate')"
+                },
+                "method": {
+                    "type": "string",
+                    "description": "HTTP method",
+                    "enum": ["GET", "POST", "PUT", "DELETE"],
+                    "default": "POST"
+                },
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "data": {
+                    "type": "object",
+                    "description": "Request payload/body for the API call"
+                },
+                "login_customer_id": {
+                    "type": "string",
+                    "description": "Manager customer ID for authentication (auto-set to ROOT_MCC if omitted for child accounts)"
+                }
+            },
+            "required": ["endpoint", "customer_id"]
+        }
+    ),
+    types.Tool(
+        name="create_campaign_budget",
+        description="Create a new campaign budget",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Budget name"
+                },
+                "amount_micros": {
+                    "type": "integer",
+                    "description": "Daily budget amount in micros (e.g., 50000000 = $50)"
+                },
+                "delivery_method": {
+                    "type": "string",
+                    "description": "Budget delivery method",
+                    "enum": ["STANDARD", "ACCELERATED"],
+                    "default": "STANDARD"
+                }
+            },
+            "required": ["customer_id", "name", "amount_micros"]
+        }
+    ),
+    types.Tool(
+        name="create_campaign",
+        description="Create a new search campaign",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Campaign name"
+                },
+                "budget_resource_name": {
+                    "type": "string",
+                    "description": "Budget resource name (from create_campaign_budget)"
+                },
+                "bidding_strategy_type": {
+                    "type": "string",
+                    "description": "Bidding strategy",
+                    "enum": list(_BIDDING_BUILDERS),
+                    "default": "MAXIMIZE_CONVERSIONS"
+                },
+                "target_cpa_micros": {
+                    "type": "integer",
+                    "description": "Target CPA in micros (for TARGET_CPA strategy)"
+                },
+                "target_roas": {
+                    "type": "number",
+                    "description": "Target ROAS (for TARGET_ROAS strategy)"
+                },
+                "geo_target_constants": {
+                    "type": "array",
+                    "description": "Array of geo target constants (e.g., ['2840'] for United States)",
+                    "items": {"type": "string"}
+                },
+                "status": {
+                    "type": "string",
+                    "description": "Campaign status",
+                    "enum": ["ENABLED", "PAUSED"],
+                    "default": "PAUSED"
+                }
+            },
+            "required": ["customer_id", "name", "budget_resource_name"]
+        }
+    ),
+    types.Tool(
+        name="create_ad_group",
+        description="Create a new ad group within a campaign",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "campaign_resource_name": {
+                    "type": "string",
+                    "description": "Campaign resource name"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Ad group name"
+                },
+                "cpc_bid_micros": {
+                    "type": "integer",
+                    "description": "Default CPC bid in micros (e.g., 3500000 = $3.50)"
+                },
+                "status": {
+                    "type": "string",
+                    "description": "Ad group status",
+                    "enum": ["ENABLED", "PAUSED"],
+                    "default": "ENABLED"
+                }
+            },
+            "required": ["customer_id", "campaign_resource_name", "name", "cpc_bid_micros"]
+        }
+    ),
+    types.Tool(
+        name="create_keywords",
+        description="Create keywords in an ad group",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "ad_group_resource_name": {
+                    "type": "string",
+                    "description": "Ad group resource name"
+                },
+                "keywords": {
+                    "type": "array",
+                    "description": "Array of keyword objects",
+                    "items": {
                         "type": "object",
-                        "description": "Campaign updates (e.g., target_roas, daily_budget_micros)"
+                        "properties": {
+                            "text": {
+                                "type": "string",
+                                "description": "Keyword text"
+                            },
+                            "match_type": {
+                                "type": "string",
+                                "description": "Keyword match type",
+                                "enum": ["EXACT", "PHRASE", "BROAD"]
+                            }
+                        },
+                        "required": ["text", "match_type"]
                     }
+                }
+            },
+            "required": ["customer_id", "ad_group_resource_name", "keywords"]
+        }
+    ),
+    types.Tool(
+        name="create_keywords_bulk",
+        description="Create keywords for several ad groups in one mutate request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
                 },
-                "required": ["customer_id", "campaign_id", "updates"]
-            }
-        ),
-        types.Tool(
-            name="lookup_docs",
-            description="Search Google Ads API documentation for field names and query examples",
-            inputSchema={
-                "type": "object", 
-                "properties": {
-                    "resource": {
-                        "type": "string",
-                        "description": "Resource to look up (e.g., 'campaign', 'ad_group', 'GoogleAdsService')"
+                "keyword_sets": {
+                    "type": "array",
+                    "description": "One entry per ad group",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "ad_group_resource_name": {
+                                "type": "string",
+                                "description": "Ad group resource name"
+                            },
+                            "keywords": {
+                                "type": "array",
+                                "description": "Keywords to add to this ad group",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "text": {"type": "string"},
+                                        "match_type": {"type": "string", "enum": ["EXACT", "PHRASE", "BROAD"]}
+                                    },
+                                    "required": ["text", "match_type"]
+                                }
+                            }
+                        },
+                        "required": ["ad_group_resource_name", "keywords"]
                     }
+                }
+            },
+            "required": ["customer_id", "keyword_sets"]
+        }
+    ),
+    types.Tool(
+        name="create_responsive_search_ad",
+        description="Create a responsive search ad",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
                 },
-                "required": ["resource"]
-            }
-        ),
-        types.Tool(
-            name="get_ai_context",
-            description="Get successful API patterns and examples for AI prompting context",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "operation_type": {
-                        "type": "string",
-                        "description": "Filter by operation type (gaql_query, campaign_mutation, etc.)"
-                    }
+                "ad_group_resource_name": {
+                    "type": "string",
+                    "description": "Ad group resource name"
+                },
+                "headlines": {
+                    "type": "array",
+                    "description": "Array of headline texts (3-15 required)",
+                    "items": {"type": "string"},
+                    "minItems": 3,
+                    "maxItems": 15
+                },
+                "descriptions": {
+                    "type": "array",
+                    "description": "Array of description texts (2-4 required)",
+                    "items": {"type": "string"},
+                    "minItems": 2,
+                    "maxItems": 4
+                },
+                "final_urls": {
+                    "type": "array",
+                    "description": "Array of final URLs",
+                    "items": {"type": "string"}
+                },
+                "path1": {
+                    "type": "string",
+                    "description": "Display path 1"
+                },
+                "path2": {
+                    "type": "string",
+                    "description": "Display path 2"
+                },
+                "validate_only": {
+                    "type": "boolean",
+                    "description": "Only have Google Ads validate the ad text exactly as given; nothing is created or auto-fixed",
+                    "default": False
                 }
-            }
-        ),
-        types.Tool(
-            name="api_call",
-            description="Make any Google Ads API call - campaigns, ad groups, keywords, budgets, etc.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "endpoint": {
-                        "type": "string",
-                        "description": "API endpoint path (e.g., 'customers/{customer_id}/campaigns:mutate', 'customers/{customer_id}/campaignBudgets:mutate')"
-                    },
-                    "method": {
-                        "type": "string",
-                        "description": "HTTP method",
-                        "enum": ["GET", "POST", "PUT", "DELETE"],
-                        "default": "POST"
-                    },
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "data": {
+            },
+            "required": ["customer_id", "ad_group_resource_name", "headlines", "descriptions", "final_urls"]
+        }
+    ),
+    types.Tool(
+        name="create_ad_like_successful_pattern",
+        description="Create a responsive search ad using the exact successful pattern from previous campaigns",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "ad_group_resource_name": {
+                    "type": "string",
+                    "description": "Ad group resource name where the ad will be created"
+                },
+                "business_name": {
+                    "type": "string",
+                    "description": "Business name to use in headlines (defaults to 'BizExplorer')"
+                }
+            },
+            "required": ["customer_id", "ad_group_resource_name"]
+        }
+    ),
+    types.Tool(
+        name="get_smart_recommendations", 
+        description="Get AI-powered recommendations based on successful patterns and account context",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "goal": {
+                    "type": "string", 
+                    "description": "Business goal (e.g., 'increase leads', 'reduce CPA', 'expand to new markets')"
+                },
+                "context": {
+                    "type": "string",
+                    "description": "Additional context about business, budget, timeline, etc."
+                }
+            },
+            "required": ["customer_id", "goal"]
+        }
+    ),
+    types.Tool(
+        name="execute_any_operation",
+        description="Execute ANY Google Ads API operation with intelligent assistance",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "operation_description": {
+                    "type": "string",
+                    "description": "Natural language description of what you want to do"
+                },
+                "parameters": {
+                    "type": "object",
+                    "description": "Optional parameters like budget, targeting, etc."
+                }
+            },
+            "required": ["customer_id", "operation_description"]
+        }
+    ),
+    types.Tool(
+        name="create_campaign_with_budget",
+        description="Create a campaign budget and a search campaign that uses it in one atomic request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "campaign_name": {
+                    "type": "string",
+                    "description": "Campaign name"
+                },
+                "amount_micros": {
+                    "type": "integer",
+                    "description": "Daily budget amount in micros (e.g., 50000000 = $50)"
+                },
+                "budget_name": {
+                    "type": "string",
+                    "description": "Budget name (defaults to '<campaign_name> Budget')"
+                },
+                "delivery_method": {
+                    "type": "string",
+                    "description": "Budget delivery method",
+                    "enum": ["STANDARD", "ACCELERATED"],
+                    "default": "STANDARD"
+                },
+                "bidding_strategy_type": {
+                    "type": "string",
+                    "description": "Bidding strategy",
+                    "enum": list(_BIDDING_BUILDERS),
+                    "default": "MAXIMIZE_CONVERSIONS"
+                },
+                "target_cpa_micros": {
+                    "type": "integer",
+                    "description": "Target CPA in micros (for TARGET_CPA strategy)"
+                },
+                "target_roas": {
+                    "type": "number",
+                    "description": "Target ROAS (for TARGET_ROAS strategy)"
+                },
+                "status": {
+                    "type": "string",
+                    "description": "Campaign status",
+                    "enum": ["ENABLED", "PAUSED"],
+                    "default": "PAUSED"
+                }
+            },
+            "required": ["customer_id", "campaign_name", "amount_micros"]
+        }
+    ),
+    types.Tool(
+        name="create_full_campaign",
+        description="Create a budget, search campaign, ad group, keywords and responsive search ad in one atomic request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "campaign_name": {
+                    "type": "string",
+                    "description": "Campaign name"
+                },
+                "amount_micros": {
+                    "type": "integer",
+                    "description": "Daily budget amount in micros (e.g., 50000000 = $50)"
+                },
+                "ad_group_name": {
+                    "type": "string",
+                    "description": "Ad group name"
+                },
+                "cpc_bid_micros": {
+                    "type": "integer",
+                    "description": "Ad group CPC bid in micros"
+                },
+                "keywords": {
+                    "type": "array",
+                    "description": "Keywords to add to the ad group",
+                    "items": {
                         "type": "object",
-                        "description": "Request payload/body for the API call"
-                    },
-                    "login_customer_id": {
-                        "type": "string",
-                        "description": "Manager customer ID for authentication (auto-set to ROOT_MCC if omitted for child accounts)"
+                        "properties": {
+                            "text": {"type": "string"},
+                            "match_type": {"type": "string", "enum": ["EXACT", "PHRASE", "BROAD"]}
+                        },
+                        "required": ["text", "match_type"]
                     }
                 },
-                "required": ["endpoint", "customer_id"]
-            }
-        ),
-        types.Tool(
-            name="create_campaign_budget",
-            description="Create a new campaign budget",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Budget name"
-                    },
-                    "amount_micros": {
-                        "type": "integer",
-                        "description": "Daily budget amount in micros (e.g., 50000000 = $50)"
-                    },
-                    "delivery_method": {
-                        "type": "string",
-                        "description": "Budget delivery method",
-                        "enum": ["STANDARD", "ACCELERATED"],
-                        "default": "STANDARD"
-                    }
+                "headlines": {
+                    "type": "array",
+                    "description": "Ad headlines (max 30 characters each, auto-fixed)",
+                    "items": {"type": "string"}
                 },
-                "required": ["customer_id", "name", "amount_micros"]
-            }
-        ),
-        types.Tool(
-            name="create_campaign",
-            description="Create a new search campaign",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Campaign name"
-                    },
-                    "budget_resource_name": {
-                        "type": "string",
-                        "description": "Budget resource name (from create_campaign_budget)"
-                    },
-                    "bidding_strategy_type": {
-                        "type": "string",
-                        "description": "Bidding strategy",
-                        "enum": ["MAXIMIZE_CONVERSIONS", "MAXIMIZE_CLICKS", "TARGET_CPA", "TARGET_ROAS", "MANUAL_CPC"],
-                        "default": "MAXIMIZE_CONVERSIONS"
-                    },
-                    "target_cpa_micros": {
-                        "type": "integer",
-                        "description": "Target CPA in micros (for TARGET_CPA strategy)"
-                    },
-                    "target_roas": {
-                        "type": "number",
-                        "description": "Target ROAS (for TARGET_ROAS strategy)"
-                    },
-                    "geo_target_constants": {
-                        "type": "array",
-                        "description": "Array of geo target constants (e.g., ['2840'] for United States)",
-                        "items": {"type": "string"}
-                    },
-                    "status": {
-                        "type": "string",
-                        "description": "Campaign status",
-                        "enum": ["ENABLED", "PAUSED"],
-                        "default": "PAUSED"
-                    }
+                "descriptions": {
+                    "type": "array",
+                    "description": "Ad descriptions (max 90 characters each, auto-fixed)",
+                    "items": {"type": "string"}
                 },
-                "required": ["customer_id", "name", "budget_resource_name"]
-            }
-        ),
-        types.Tool(
-            name="create_ad_group",
-            description="Create a new ad group within a campaign",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "campaign_resource_name": {
-                        "type": "string",
-                        "description": "Campaign resource name"
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Ad group name"
-                    },
-                    "cpc_bid_micros": {
-                        "type": "integer",
-                        "description": "Default CPC bid in micros (e.g., 3500000 = $3.50)"
-                    },
-                    "status": {
-                        "type": "string",
-                        "description": "Ad group status",
-                        "enum": ["ENABLED", "PAUSED"],
-                        "default": "ENABLED"
-                    }
+                "final_urls": {
+                    "type": "array",
+                    "description": "Landing page URLs",
+                    "items": {"type": "string"}
                 },
-                "required": ["customer_id", "campaign_resource_name", "name", "cpc_bid_micros"]
-            }
-        ),
-        types.Tool(
-            name="create_keywords",
-            description="Create keywords in an ad group",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "ad_group_resource_name": {
-                        "type": "string",
-                        "description": "Ad group resource name"
-                    },
-                    "keywords": {
-                        "type": "array",
-                        "description": "Array of keyword objects",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "text": {
-                                    "type": "string",
-                                    "description": "Keyword text"
-                                },
-                                "match_type": {
-                                    "type": "string",
-                                    "description": "Keyword match type",
-                                    "enum": ["EXACT", "PHRASE", "BROAD"]
-                                }
-                            },
-                            "required": ["text", "match_type"]
-                        }
-                    }
+                "budget_name": {
+                    "type": "string",
+                    "description": "Budget name (defaults to '<campaign_name> Budget')"
                 },
-                "required": ["customer_id", "ad_group_resource_name", "keywords"]
-            }
-        ),
-        types.Tool(
-            name="create_responsive_search_ad",
-            description="Create a responsive search ad",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "ad_group_resource_name": {
-                        "type": "string",
-                        "description": "Ad group resource name"
-                    },
-                    "headlines": {
-                        "type": "array",
-                        "description": "Array of headline texts (3-15 required)",
-                        "items": {"type": "string"},
-                        "minItems": 3,
-                        "maxItems": 15
-                    },
-                    "descriptions": {
-                        "type": "array",
-                        "description": "Array of description texts (2-4 required)",
-                        "items": {"type": "string"},
-                        "minItems": 2,
-                        "maxItems": 4
-                    },
-                    "final_urls": {
-                        "type": "array",
-                        "description": "Array of final URLs",
-                        "items": {"type": "string"}
-                    },
-                    "path1": {
-                        "type": "string",
-                        "description": "Display path 1"
-                    },
-                    "path2": {
-                        "type": "string",
-                        "description": "Display path 2"
-                    }
+                "bidding_strategy_type": {
+                    "type": "string",
+                    "description": "Bidding strategy",
+                    "enum": list(_BIDDING_BUILDERS),
+                    "default": "MAXIMIZE_CONVERSIONS"
                 },
-                "required": ["customer_id", "ad_group_resource_name", "headlines", "descriptions", "final_urls"]
-            }
-        ),
-        types.Tool(
-            name="create_ad_like_successful_pattern",
-            description="Create a responsive search ad using the exact successful pattern from previous campaigns",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "ad_group_resource_name": {
-                        "type": "string",
-                        "description": "Ad group resource name where the ad will be created"
-                    },
-                    "business_name": {
-                        "type": "string",
-                        "description": "Business name to use in headlines (defaults to 'BizExplorer')"
-                    }
+                "target_cpa_micros": {
+                    "type": "integer",
+                    "description": "Target CPA in micros (for TARGET_CPA strategy)"
                 },
-                "required": ["customer_id", "ad_group_resource_name"]
-            }
-        ),
-        types.Tool(
-            name="get_smart_recommendations", 
-            description="Get AI-powered recommendations based on successful patterns and account context",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "goal": {
-                        "type": "string", 
-                        "description": "Business goal (e.g., 'increase leads', 'reduce CPA', 'expand to new markets')"
-                    },
-                    "context": {
-                        "type": "string",
-                        "description": "Additional context about business, budget, timeline, etc."
-                    }
+                "target_roas": {
+                    "type": "number",
+                    "description": "Target ROAS (for TARGET_ROAS strategy)"
                 },
-                "required": ["customer_id", "goal"]
-            }
-        ),
-        types.Tool(
-            name="execute_any_operation",
-            description="Execute ANY Google Ads API operation with intelligent assistance",
-            inputSchema={
-                "type": "object", 
-                "properties": {
-                    "customer_id": {
-                        "type": "string",
-                        "description": "Google Ads customer ID"
-                    },
-                    "operation_description": {
-                        "type": "string",
-                        "description": "Natural language description of what you want to do"
-                    },
-                    "parameters": {
+                "status": {
+                    "type": "string",
+                    "description": "Campaign status",
+                    "enum": ["ENABLED", "PAUSED"],
+                    "default": "PAUSED"
+                },
+                "path1": {
+                    "type": "string",
+                    "description": "Display URL path 1"
+                },
+                "path2": {
+                    "type": "string",
+                    "description": "Display URL path 2"
+                }
+            },
+            "required": ["customer_id", "campaign_name", "amount_micros", "ad_group_name", "cpc_bid_micros",
+                         "keywords", "headlines", "descriptions", "final_urls"]
+        }
+    ),
+    types.Tool(
+        name="create_ad_group_tree",
+        description="Create an ad group with its keywords and a responsive search ad in one atomic request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "customer_id": {
+                    "type": "string",
+                    "description": "Google Ads customer ID"
+                },
+                "campaign_resource_name": {
+                    "type": "string",
+                    "description": "Campaign resource name"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Ad group name"
+                },
+                "cpc_bid_micros": {
+                    "type": "integer",
+                    "description": "CPC bid in micros"
+                },
+                "keywords": {
+                    "type": "array",
+                    "description": "Keywords to add to the ad group",
+                    "items": {
                         "type": "object",
-                        "description": "Optional parameters like budget, targeting, etc."
+                        "properties": {
+                            "text": {"type": "string"},
+                            "match_type": {"type": "string", "enum": ["EXACT", "PHRASE", "BROAD"]}
+                        },
+                        "required": ["text", "match_type"]
                     }
                 },
-                "required": ["customer_id", "operation_description"]
-            }
-        )
-    ]
+                "headlines": {
+                    "type": "array",
+                    "description": "Ad headlines (max 30 characters each, auto-fixed)",
+                    "items": {"type": "string"}
+                },
+                "descriptions": {
+                    "type": "array",
+                    "description": "Ad descriptions (max 90 characters each, auto-fixed)",
+                    "items": {"type": "string"}
+                },
+                "final_urls": {
+                    "type": "array",
+                    "description": "Landing page URLs",
+                    "items": {"type": "string"}
+                },
+                "status": {
+                    "type": "string",
+                    "description": "Ad group status",
+                    "enum": ["ENABLED", "PAUSED"],
+                    "default": "ENABLED"
+                },
+                "path1": {
+                    "type": "string",
+                    "description": "Display URL path 1"
+                },
+                "path2": {
+                    "type": "string",
+                    "description": "Display URL path 2"
+                }
+            },
+            "required": ["customer_id", "campaign_resource_name", "name", "cpc_bid_micros",
+                         "keywords", "headlines", "descriptions", "final_urls"]
+        }
+    ),
+    types.Tool(
+        name="batch_call_tools",
+        description="Run several independent tool calls concurrently; returns one result per call in order",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run concurrently",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Tool name"
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool"
+                            }
+                        },
+                        "required": ["name"]
+                    }
+                }
+            },
+            "required": ["calls"]
+        }
+    )
+]
 
-@server.call_tool()
-async def handle_call_tool(
-    name: str, arguments: dict[str, Any] | None
-) -> list[types.TextContent]:
-    """Handle tool calls"""
+# Required arguments per tool, precomputed from the input schemas
+_REQUIRED_ARGUMENTS: dict[str, tuple[str, ...]] = {
+    tool.name: tuple(tool.inputSchema.get("required", ())) for tool in _TOOLS
+}
+
+def _validate_arguments(name: str, arguments: dict[str, Any]):
+    """Reject calls that omit a required argument before dispatching them"""
+    missing = [arg for arg in _REQUIRED_ARGUMENTS.get(name, ()) if arg not in arguments]
+    if missing:
+        raise ValueError(f"Missing required argument(s) for {name}: {', '.join(missing)}")
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """List available Google Ads tools"""
+    return _TOOLS
+
+# Responses of idempotent read tools, keyed by (customer_id, arguments)
+_RESPONSE_CACHES: dict[str, _TTLCache] = {
+    "search_campaigns": _TTLCache(maxsize=256, ttl=10),
+    "get_account_info": _TTLCache(maxsize=256, ttl=60),
+    "lookup_docs": _TTLCache(maxsize=64),  # Static tables, never expire
+}
+
+# Tools that never change account state, so they leave the response caches alone
+_READ_ONLY_TOOLS = frozenset({
+    "search_campaigns", "get_account_info", "lookup_docs", "run_gaql", "get_ai_context", "get_smart_recommendations"
+})
+
+async def _dispatch_one(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Run a single tool by name and return its raw result"""
+    handler = TOOL_HANDLERS.get(name)
+    if not handler:
+        raise ValueError(f"Unknown tool: {name}")
+    
+    # Optional arguments fall back to the handler's own keyword defaults
+    accepted = _HANDLER_PARAMETERS[name]
+    kwargs = {key: value for key, value in arguments.items() if key in accepted}
+    
+    cache = _RESPONSE_CACHES.get(name)
+    if cache is None:
+        result = await handler(**kwargs)
+        # Anything that is not a pure read may have changed this customer's cached reads
+        customer_id = kwargs.get("customer_id")
+        if customer_id and name not in _READ_ONLY_TOOLS and not kwargs.get("validate_only"):
+            for read_cache in _RESPONSE_CACHES.values():
+                read_cache.discard_where(lambda key: key[0] == customer_id)
+        return result
+    
+    # Sorted JSON gives a hashable key even when a client sends list or dict values
+    try:
+        cache_key = (kwargs.get("customer_id"), orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS))
+        hash(cache_key)
+    except TypeError:
+        # e.g. a non-string customer_id; such calls just skip the cache
+        return await handler(**kwargs)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return dict(cached)
+    result = await handler(**kwargs)
+    if not result.get("error"):
+        cache.set(cache_key, dict(result))
+    return result
+
+# Tools whose results always carry ai_guidance
+_CONTEXT_TOOLS = frozenset({"lookup_docs", "get_ai_context"})
+
+async def _build_ai_guidance_snippet() -> dict[str, Any]:
+    """The slice of get_ai_context attached to errors and empty results"""
+    ai_context = (await get_ai_context())["context"]
+    return {
+        "proven_queries": [_proven_query(q) for q in api_logger.get_recent_successful(3)],  # Last 3 successful
+        "best_practices": ai_context["ai_guidance"]["best_practices"],
+        "common_errors_to_avoid": ai_context["ai_guidance"]["common_errors_to_avoid"],
+        "working_customer_ids": ai_context["successful_patterns"]["working_customer_ids"]
+    }
+
+async def _call_tool(name: str, arguments: dict[str, Any] | None) -> dict[str, Any]:
+    """Run a single tool and attach AI guidance to errors and empty results"""
     if arguments is None:
         arguments = {}
     
     try:
-        if name == "search_campaigns":
-            result = await search_campaigns(
-                customer_id=arguments["customer_id"],
-                limit=arguments.get("limit", 10)
-            )
-        elif name == "run_gaql":
-            result = await run_gaql(
-                customer_id=arguments["customer_id"],
-                query=arguments["query"],
-                parallel=arguments.get("parallel", False),
-                login_customer_id=arguments.get("login_customer_id")
-            )
-        elif name == "get_account_info":
-            result = await get_account_info(
-                customer_id=arguments["customer_id"]
-            )
-        elif name == "mutate_campaign":
-            result = await mutate_campaign(
-                customer_id=arguments["customer_id"],
-                campaign_id=arguments["campaign_id"],
-                updates=arguments["updates"]
-            )
-        elif name == "lookup_docs":
-            result = await lookup_docs(
-                resource=arguments["resource"]
-            )
-        elif name == "get_ai_context":
-            result = await get_ai_context(
-                operation_type=arguments.get("operation_type")
-            )
-        elif name == "api_call":
-            result = await api_call(
-                endpoint=arguments["endpoint"],
-                customer_id=arguments["customer_id"],
-                method=arguments.get("method", "POST"),
-                data=arguments.get("data", {}),
-                login_customer_id=arguments.get("login_customer_id")
-            )
-        elif name == "create_campaign_budget":
-            result = await create_campaign_budget(
-                customer_id=arguments["customer_id"],
-                name=arguments["name"],
-                amount_micros=arguments["amount_micros"],
-                delivery_method=arguments.get("delivery_method", "STANDARD")
-            )
-        elif name == "create_campaign":
-            result = await create_campaign(
-                customer_id=arguments["customer_id"],
-                name=arguments["name"],
-                budget_resource_name=arguments["budget_resource_name"],
-                bidding_strategy_type=arguments.get("bidding_strategy_type", "MAXIMIZE_CONVERSIONS"),
-                target_cpa_micros=arguments.get("target_cpa_micros"),
-                target_roas=arguments.get("target_roas"),
-                geo_target_constants=arguments.get("geo_target_constants", []),
-                status=arguments.get("status", "PAUSED")
-            )
-        elif name == "create_ad_group":
-            result = await create_ad_group(
-                customer_id=arguments["customer_id"],
-                campaign_resource_name=arguments["campaign_resource_name"],
-                name=arguments["name"],
-                cpc_bid_micros=arguments["cpc_bid_micros"],
-                status=arguments.get("status", "ENABLED")
-            )
-        elif name == "create_keywords":
-            result = await create_keywords(
-                customer_id=arguments["customer_id"],
-                ad_group_resource_name=arguments["ad_group_resource_name"],
-                keywords=arguments["keywords"]
-            )
-        elif name == "create_responsive_search_ad":
-            result = await create_responsive_search_ad(
-                customer_id=arguments["customer_id"],
-                ad_group_resource_name=arguments["ad_group_resource_name"],
-                headlines=arguments["headlines"],
-                descriptions=arguments["descriptions"],
-                final_urls=arguments["final_urls"],
-                path1=arguments.get("path1"),
-                path2=arguments.get("path2")
-            )
-        elif name == "create_ad_like_successful_pattern":
-            result = await create_ad_like_successful_pattern(
-                customer_id=arguments["customer_id"],
-                ad_group_resource_name=arguments["ad_group_resource_name"],
-                business_name=arguments.get("business_name", "BizExplorer")
-            )
-        elif name == "get_smart_recommendations":
-            result = await get_smart_recommendations(
-                customer_id=arguments["customer_id"],
-                goal=arguments["goal"],
-                context=arguments.get("context", "")
-            )
-        elif name == "execute_any_operation":
-            result = await execute_any_operation(
-                customer_id=arguments["customer_id"],
-                operation_description=arguments["operation_description"],
-                parameters=arguments.get("parameters", {})
-            )
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+        _validate_arguments(name, arguments)
+        result = await _dispatch_one(name, arguments)
         
         # Auto-inject AI context when there are errors or for guidance
-        should_include_context = (
-            "error" in result or 
-            name in ["lookup_docs", "get_ai_context"] or
-            (isinstance(result, dict) and not result.get("results"))
+        should_include_context = name in _CONTEXT_TOOLS or (
+            isinstance(result, dict) and ("error" in result or not result.get("results"))
         )
         
         if should_include_context:
-            ai_context = await get_ai_context()
-            result["ai_guidance"] = {
-                "proven_queries": ai_context["context"]["ai_guidance"]["proven_queries"][-3:],  # Last 3 successful
-                "best_practices": ai_context["context"]["ai_guidance"]["best_practices"],
-                "common_errors_to_avoid": ai_context["context"]["ai_guidance"]["common_errors_to_avoid"],
-                "working_customer_ids": ai_context["context"]["successful_patterns"]["working_customer_ids"]
-            }
+            result["ai_guidance"] = await _build_ai_guidance_snippet()
         
-        return [
-            types.TextContent(
-                type="text",
-                text=json.dumps(result, indent=2, ensure_ascii=False)
-            )
-        ]
+        return result
     except Exception as e:
         # Always include AI guidance when there's an exception
-        ai_context = await get_ai_context()
         error_result = {
             "error": str(e),
-            "ai_guidance": {
-                "proven_queries": ai_context["context"]["ai_guidance"]["proven_queries"][-3:],
-                "best_practices": ai_context["context"]["ai_guidance"]["best_practices"],
-                "common_errors_to_avoid": ai_context["context"]["ai_guidance"]["common_errors_to_avoid"],
-                "working_customer_ids": ai_context["context"]["successful_patterns"]["working_customer_ids"]
-            }
+            "ai_guidance": await _build_ai_guidance_snippet()
         }
         
-        return [
-            types.TextContent(
-                type="text",
-                text=json.dumps(error_result, indent=2, ensure_ascii=False)
-            )
-        ]
+        return error_result
 
-async def search_campaigns(customer_id: str, limit: int = 10) -> dict[str, Any]:
-    """Search for campaigns in the specified customer account"""
-    query = f"""
+def _text_content(result: dict[str, Any]) -> types.TextContent:
+    """Serialize a tool result for the MCP client"""
+    return types.TextContent(
+        type="text",
+        text=orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=_json_default).decode()
+    )
+
+async def handle_call_tool_batch(calls: list) -> list[types.TextContent]:
+    """Run independent tool calls concurrently, returning one TextContent per call in order"""
+    async def _run(call: dict) -> dict[str, Any]:
+        name = call.get("name")
+        if name == "batch_call_tools":
+            return {"name": name, "error": "batch_call_tools cannot be nested"}
+        return {"name": name, **await _call_tool(name, call.get("arguments"))}
+    
+    results = await asyncio.gather(*(_run(call) for call in calls), return_exceptions=True)
+    return [
+        _text_content({"error": str(result)} if isinstance(result, BaseException) else result)
+        for result in results
+    ]
+
+@server.call_tool()
+async def handle_call_tool(
+    name: str, arguments: dict[str, Any] | None
+) -> list[types.TextContent]:
+    """Handle tool calls"""
+    if name == "batch_call_tools":
+        return await handle_call_tool_batch((arguments or {}).get("calls", []))
+    
+    return [_text_content(await _call_tool(name, arguments))]
+
+# Static GAQL; search_campaigns appends its LIMIT value
+_SEARCH_CAMPAIGNS_QUERY = """
         SELECT 
             campaign.id,
             campaign.name,
@@ -937,14 +1627,9 @@ async def search_campaigns(customer_id: str, limit: int = 10) -> dict[str, Any]:
             metrics.cost_micros
         FROM campaign
         WHERE campaign.status != 'REMOVED'
-        LIMIT {limit}
-    """
-    
-    return await run_gaql(customer_id, query)
+        LIMIT """
 
-async def get_account_info(customer_id: str) -> dict[str, Any]:
-    """Get basic account information"""
-    query = """
+_ACCOUNT_INFO_QUERY = """
         SELECT 
             customer.id,
             customer.descriptive_name,
@@ -955,22 +1640,66 @@ async def get_account_info(customer_id: str) -> dict[str, Any]:
         FROM customer
         WHERE customer.id = customer.id
     """
-    
-    return await run_gaql(customer_id, query)
 
-async def run_gaql(customer_id: str, query: str, parallel: bool = False, login_customer_id: Optional[str] = None) -> dict[str, Any]:
-    """Execute a GAQL query with automatic retry for child account access"""
+async def search_campaigns(customer_id: str, limit: int = 10) -> dict[str, Any]:
+    """Search for campaigns in the specified customer account"""
+    return await run_gaql(customer_id, f"{_SEARCH_CAMPAIGNS_QUERY}{int(limit)}")
+
+# Accounts that answered not found, so repeated lookups skip the API for a minute.
+# Permission errors are not cached: the user may be fixing access right now.
+_MISSING_ACCOUNTS = _TTLCache(maxsize=256, ttl=60)
+
+async def get_account_info(customer_id: str) -> dict[str, Any]:
+    """Get basic account information"""
+    cached = _MISSING_ACCOUNTS.get(customer_id)
+    if cached is not None:
+        return dict(cached)
+    result = await run_gaql(customer_id, _ACCOUNT_INFO_QUERY)
+    if result["error"] and (result["http_status"] == 404 or "CUSTOMER_NOT_FOUND" in str(result["error"])):
+        _MISSING_ACCOUNTS.set(customer_id, dict(result))
+    return result
+
+# Customer IDs that answered 403 without a login-customer-id header this session
+_CHILD_ACCOUNTS: set[str] = set()
+
+GAQL_STREAM_MIN_LIMIT = 10000  # Queries with a larger LIMIT (or none) use searchStream by default
+_GAQL_LIMIT_RE = re.compile(r"\bLIMIT\s+(\d+)", re.IGNORECASE)
+
+def _should_stream(query: str) -> bool:
+    """Whether a query may return enough rows to be worth streaming"""
+    match = _GAQL_LIMIT_RE.search(query)
+    return match is None or int(match.group(1)) > GAQL_STREAM_MIN_LIMIT
+
+async def run_gaql(customer_id: str, query: str, parallel: bool = False, login_customer_id: Optional[str] = None,
+                   stream: Optional[bool] = None) -> dict[str, Any]:
+    """Execute a GAQL query with automatic retry for child account access
+    
+    Large queries go through googleAds:searchStream, which returns every row in one
+    response instead of page by page; pass stream to force either endpoint.
+    """
     data = {
         "query": query
     }
+    if stream is None:
+        stream = _should_stream(query)
+    endpoint = f"customers/{customer_id}/googleAds:{'searchStream' if stream else 'search'}"
     
-    # First attempt - use provided login_customer_id or none
-    result = make_google_ads_request(f"customers/{customer_id}/googleAds:search", data, "POST", login_customer_id)
+    # Accounts already known to be children go straight through ROOT_MCC
+    if login_customer_id is None and customer_id in _CHILD_ACCOUNTS:
+        result = await make_google_ads_request(endpoint, data, "POST", ROOT_MCC)
+    else:
+        # First attempt - use provided login_customer_id or none
+        result = await make_google_ads_request(endpoint, data, "POST", login_customer_id)
+        
+        # Check for 403 Forbidden error and retry with ROOT_MCC if accessing child account
+        if "error" in result and "403" in str(result["error"]) and login_customer_id is None and customer_id != ROOT_MCC:
+            print(f"Retrying with login_customer_id={ROOT_MCC} for child account {customer_id}", file=sys.stderr)
+            _CHILD_ACCOUNTS.add(customer_id)
+            result = await make_google_ads_request(endpoint, data, "POST", ROOT_MCC)
     
-    # Check for 403 Forbidden error and retry with ROOT_MCC if accessing child account
-    if "error" in result and "403" in str(result["error"]) and login_customer_id is None and customer_id != ROOT_MCC:
-        print(f"Retrying with login_customer_id={ROOT_MCC} for child account {customer_id}", file=sys.stderr)
-        result = make_google_ads_request(f"customers/{customer_id}/googleAds:search", data, "POST", ROOT_MCC)
+    if isinstance(result, list):
+        # Flatten the stream's batches into one row list
+        result = {"results": [row for batch in result for row in batch.get("results", ())]}
     
     # Check if we got empty results and suggest documentation lookup
     results = result.get("results", [])
@@ -994,23 +1723,56 @@ async def run_gaql(customer_id: str, query: str, parallel: bool = False, login_c
     
     # Always include minimal context for failed queries
     if error or not results:
-        patterns = api_logger.get_patterns("gaql_query")
-        if patterns["successful_queries"]:
-            result["recent_successful_queries"] = [
-                q["query"] for q in patterns["successful_queries"][-2:] 
-                if q["customer_id"] == customer_id
-            ]
+        recent = api_logger.get_recent_successful(2, customer_id, "gaql_query")
+        if recent:
+            result["recent_successful_queries"] = [q.query for q in recent]
     
     return {
         "customer_id": customer_id,
         "query": query,
         "parallel": parallel,
+        "stream": stream,
         "login_customer_id": login_customer_id or (ROOT_MCC if customer_id != ROOT_MCC else None),
         "results": results,
         "error": error,
-        "suggestion": result.get("suggestion")
+        "suggestion": result.get("suggestion"),
+        "recent_successful_queries": result.get("recent_successful_queries"),
+        "http_status": result.get("http_status")
     }
 
+def _update_target_roas(value, update: dict, mask: list):
+    # For standard bidding strategies using target_roas field
+    update["target_roas"] = {"target_roas": value}
+    mask.append("target_roas.target_roas")
+
+def _update_maximize_conversion_value(value, update: dict, mask: list):
+    # For maximize conversion value bidding strategy
+    update["maximize_conversion_value"] = value
+    if "target_roas" in value:
+        mask.append("maximize_conversion_value.target_roas")
+
+def _update_mcv_target_roas(value, update: dict, mask: list):
+    # Direct maximize_conversion_value target_roas updates
+    update["maximize_conversion_value"] = {"target_roas": value}
+    mask.append("maximize_conversion_value.target_roas")
+
+def _update_daily_budget_micros(value, update: dict, mask: list):
+    update["campaign_budget"] = {"amount_micros": value}
+    mask.append("campaign_budget.amount_micros")
+
+def _update_status(value, update: dict, mask: list):
+    update["status"] = value
+    mask.append("status")
+
+# mutate_campaign update key -> writer for the campaign fields and update mask
+_UPDATE_HANDLERS: dict[str, Callable[[Any, dict, list], None]] = {
+    "target_roas": _update_target_roas,
+    "maximize_conversion_value": _update_maximize_conversion_value,
+    "mcv_target_roas": _update_mcv_target_roas,
+    "daily_budget_micros": _update_daily_budget_micros,
+    "status": _update_status,
+}
+
 async def mutate_campaign(customer_id: str, campaign_id: str, updates: dict) -> dict[str, Any]:
     """Update campaign settings like ROAS targets or budgets"""
     
@@ -1023,31 +1785,13 @@ async def mutate_campaign(customer_id: str, campaign_id: str, updates: dict) ->
     
     # Build update mask based on provided updates
     update_mask_fields = []
-    
-    # Handle different ROAS field structures
-    if "target_roas" in updates:
-        # For standard bidding strategies using target_roas field
-        operation["update"]["target_roas"] = {"target_roas": updates["target_roas"]}
-        update_mask_fields.append("target_roas.target_roas")
-    
-    if "maximize_conversion_value" in updates:
-        # For maximize conversion value bidding strategy
-        operation["update"]["maximize_conversion_value"] = updates["maximize_conversion_value"]
-        if "target_roas" in updates["maximize_conversion_value"]:
-            update_mask_fields.append("maximize_conversion_value.target_roas")
-    
-    # Handle direct maximize_conversion_value target_roas updates
-    if "mcv_target_roas" in updates:
-        operation["update"]["maximize_conversion_value"] = {"target_roas": updates["mcv_target_roas"]}
-        update_mask_fields.append("maximize_conversion_value.target_roas")
-    
-    if "daily_budget_micros" in updates:
-        operation["update"]["campaign_budget"] = {"amount_micros": updates["daily_budget_micros"]}
-        update_mask_fields.append("campaign_budget.amount_micros")
-    
-    if "status" in updates:
-        operation["update"]["status"] = updates["status"]
-        update_mask_fields.append("status")
+    ignored_updates = []
+    for key, value in updates.items():
+        handler = _UPDATE_HANDLERS.get(key)
+        if handler:
+            handler(value, operation["update"], update_mask_fields)
+        else:
+            ignored_updates.append(key)
     
     # Ensure we have an update mask
     if not update_mask_fields:
@@ -1055,6 +1799,7 @@ async def mutate_campaign(customer_id: str, campaign_id: str, updates: dict) ->
             "customer_id": customer_id,
             "campaign_id": campaign_id,
             "updates": updates,
+            "ignored_updates": ignored_updates,
             "error": "No valid fields provided for update. Use 'mcv_target_roas' for maximize conversion value campaigns."
         }
     
@@ -1066,7 +1811,7 @@ async def mutate_campaign(customer_id: str, campaign_id: str, updates: dict) ->
     
     # Use ROOT_MCC if accessing child account
     login_customer_id = ROOT_MCC if customer_id != ROOT_MCC else None
-    result = make_google_ads_request(f"customers/{customer_id}/campaigns:mutate", data, "POST", login_customer_id, "campaign_creation")
+    result = await make_google_ads_request(f"customers/{customer_id}/campaigns:mutate", data, "POST", login_customer_id, "campaign_creation")
     
     # Log successful mutations
     if not result.get("error") and result.get("results"):
@@ -1087,86 +1832,118 @@ async def mutate_campaign(customer_id: str, campaign_id: str, updates: dict) ->
         "customer_id": customer_id,
         "campaign_id": campaign_id,
         "updates": updates,
+        "ignored_updates": ignored_updates,
         "operation": operation,
         "result": result.get("results", []),
         "error": result.get("error")
     }
 
-async def lookup_docs(resource: str) -> dict[str, Any]:
-    """Provide documentation links and field examples for Google Ads API resources"""
-    
-    docs_info = {
-        "campaign": {
-            "description": "Campaign resource for managing advertising campaigns",
-            "common_fields": [
-                "campaign.id", "campaign.name", "campaign.status", 
-                "campaign.target_roas.target_roas", "campaign.maximize_conversion_value.target_roas",
-                "campaign.bidding_strategy_type", "campaign.advertising_channel_type", "campaign.campaign_budget"
-            ],
-            "example_query": "SELECT campaign.id, campaign.name, campaign.maximize_conversion_value.target_roas FROM campaign WHERE campaign.status = 'ENABLED'",
-            "mutation_examples": {
-                "update_mcv_roas": {
-                    "description": "Update ROAS for maximize conversion value campaigns",
-                    "example": "mutate_campaign(customer_id='123', campaign_id='456', updates={'mcv_target_roas': 27.5})"
-                },
-                "update_standard_roas": {
-                    "description": "Update ROAS for standard bidding strategies", 
-                    "example": "mutate_campaign(customer_id='123', campaign_id='456', updates={'target_roas': 27.5})"
-                },
-                "update_maximize_conversion_value": {
-                    "description": "Update maximize conversion value settings",
-                    "example": "mutate_campaign(customer_id='123', campaign_id='456', updates={'maximize_conversion_value': {'target_roas': 27.5}})"
-                }
+# Documentation served by lookup_docs, built once at import
+_DOCS_INFO: dict[str, dict] = {
+    "campaign": {
+        "description": "Campaign resource for managing advertising campaigns",
+        "common_fields": [
+            "campaign.id", "campaign.name", "campaign.status", 
+            "campaign.target_roas.target_roas", "campaign.maximize_conversion_value.target_roas",
+            "campaign.bidding_strategy_type", "campaign.advertising_channel_type", "campaign.campaign_budget"
+        ],
+        "example_query": "SELECT campaign.id, campaign.name, campaign.maximize_conversion_value.target_roas FROM campaign WHERE campaign.status = 'ENABLED'",
+        "mutation_examples": {
+            "update_mcv_roas": {
+                "description": "Update ROAS for maximize conversion value campaigns",
+                "example": "mutate_campaign(customer_id='123', campaign_id='456', updates={'mcv_target_roas': 27.5})"
             },
-            "docs_url": "https://developers.google.com/google-ads/api/reference/rpc/v20/Campaign"
-        },
-        "customer": {
-            "description": "Customer account information", 
-            "common_fields": [
-                "customer.id", "customer.descriptive_name", "customer.currency_code",
-                "customer.time_zone", "customer.auto_tagging_enabled"
-            ],
-            "example_query": "SELECT customer.id, customer.descriptive_name FROM customer",
-            "docs_url": "https://developers.google.com/google-ads/api/reference/rpc/v20/Customer"
-        },
-        "customer_client": {
-            "description": "Manager-client relationship information",
-            "common_fields": [
-                "customer_client.id", "customer_client.descriptive_name", 
-                "customer_client.status", "customer_client.level"
-            ],
-            "example_query": "SELECT customer_client.id, customer_client.descriptive_name FROM customer_client",
-            "docs_url": "https://developers.google.com/google-ads/api/reference/rpc/v20/CustomerClient"
-        },
-        "GoogleAdsService": {
-            "description": "Main service for querying Google Ads data",
-            "methods": ["search", "searchStream", "mutate"],
-            "gaql_reference": "https://developers.google.com/google-ads/api/docs/query/overview",
-            "common_errors": {
-                "403_forbidden": "Add login_customer_id header for child accounts",
-                "400_bad_request": "Check GAQL syntax and field names",
-                "empty_results": "Verify customer_id and query conditions"
+            "update_standard_roas": {
+                "description": "Update ROAS for standard bidding strategies", 
+                "example": "mutate_campaign(customer_id='123', campaign_id='456', updates={'target_roas': 27.5})"
+            },
+            "update_maximize_conversion_value": {
+                "description": "Update maximize conversion value settings",
+                "example": "mutate_campaign(customer_id='123', campaign_id='456', updates={'maximize_conversion_value': {'target_roas': 27.5}})"
             }
+        },
+        "docs_url": "https://developers.google.com/google-ads/api/reference/rpc/v20/Campaign"
+    },
+    "customer": {
+        "description": "Customer account information", 
+        "common_fields": [
+            "customer.id", "customer.descriptive_name", "customer.currency_code",
+            "customer.time_zone", "customer.auto_tagging_enabled"
+        ],
+        "example_query": "SELECT customer.id, customer.descriptive_name FROM customer",
+        "docs_url": "https://developers.google.com/google-ads/api/reference/rpc/v20/Customer"
+    },
+    "customer_client": {
+        "description": "Manager-client relationship information",
+        "common_fields": [
+            "customer_client.id", "customer_client.descriptive_name", 
+            "customer_client.status", "customer_client.level"
+        ],
+        "example_query": "SELECT customer_client.id, customer_client.descriptive_name FROM customer_client",
+        "docs_url": "https://developers.google.com/google-ads/api/reference/rpc/v20/CustomerClient"
+    },
+    "GoogleAdsService": {
+        "description": "Main service for querying Google Ads data",
+        "methods": ["search", "searchStream", "mutate"],
+        "gaql_reference": "https://developers.google.com/google-ads/api/docs/query/overview",
+        "common_errors": {
+            "403_forbidden": "Add login_customer_id header for child accounts",
+            "400_bad_request": "Check GAQL syntax and field names",
+            "empty_results": "Verify customer_id and query conditions"
         }
     }
+}
+
+# Frozen so the shared entries can be returned without copying; lookups are case-insensitive
+_DOCS_INFO_BY_NAME: dict[str, MappingProxyType] = {name.lower(): _freeze(info) for name, info in _DOCS_INFO.items()}
+_DOCS_RESOURCES = tuple(_DOCS_INFO)
+
+async def lookup_docs(resource: str) -> dict[str, Any]:
+    """Provide documentation links and field examples for Google Ads API resources"""
     
-    if resource.lower() in docs_info:
+    info = _DOCS_INFO_BY_NAME.get(resource.lower())
+    if info is not None:
         return {
             "resource": resource,
-            "info": docs_info[resource.lower()],
+            "info": info,
             "status": "found"
         }
     else:
         return {
             "resource": resource,
             "error": f"No documentation found for '{resource}'",
-            "available_resources": list(docs_info.keys()),
+            "available_resources": list(_DOCS_RESOURCES),
             "status": "not_found"
         }
 
+AI_CONTEXT_CACHE_TTL = 10  # Seconds a get_ai_context result is reused while no new success is logged
+# get_ai_context results keyed by (operation_type, api_logger.version)
+_AI_CONTEXT_CACHE = _TTLCache(maxsize=16, ttl=AI_CONTEXT_CACHE_TTL)
+
 async def get_ai_context(operation_type: str = None) -> dict[str, Any]:
     """Get AI context from successful API patterns"""
     
+    key = (operation_type, api_logger.version)
+    result = _AI_CONTEXT_CACHE.get(key)
+    if result is None:
+        result = _build_ai_context_result(operation_type)
+        _AI_CONTEXT_CACHE.set(key, result)
+    
+    # Shallow copy so callers can attach keys without touching the cached result
+    return dict(result)
+
+def _proven_query(query_info: RecentSuccess) -> dict[str, Any]:
+    """Shape a recent-success summary as an ai_guidance proven query"""
+    return {
+        "template": query_info.query,
+        "customer_id": query_info.customer_id,
+        "operation": query_info.operation,
+        "result_count": query_info.result_count
+    }
+
+def _build_ai_context_result(operation_type: Optional[str]) -> dict[str, Any]:
+    """Assemble the get_ai_context result from the recent success log"""
+    
     patterns = api_logger.get_patterns(operation_type)
     
     # Build AI guidance based on successful patterns
@@ -1181,14 +1958,9 @@ async def get_ai_context(operation_type: str = None) -> dict[str, Any]:
     }
     
     # Analyze successful queries for patterns
-    for query_info in patterns["successful_queries"]:
-        if query_info["result_count"] > 0:
-            context["ai_guidance"]["proven_queries"].append({
-                "template": query_info["query"],
-                "customer_id": query_info["customer_id"],
-                "operation": query_info["operation"],
-                "result_count": query_info["result_count"]
-            })
+    context["ai_guidance"]["proven_queries"] = [
+        _proven_query(query_info) for query_info in patterns["successful_queries"] if query_info.result_count > 0
+    ]
     
     # Add best practices based on learned patterns
     if operation_type == "gaql_query" or operation_type is None:
@@ -1224,7 +1996,7 @@ async def get_ai_context(operation_type: str = None) -> dict[str, Any]:
         "operation_type": operation_type or "all",
         "context": context,
         "summary": f"Found {len(patterns['successful_queries'])} successful patterns",
-        "last_updated": datetime.now().isoformat()
+        "last_updated": _iso_now()
     }
 
 async def api_call(endpoint: str, customer_id: str, method: str = "POST", data: dict = None, login_customer_id: Optional[str] = None) -> dict[str, Any]:
@@ -1239,7 +2011,7 @@ async def api_call(endpoint: str, customer_id: str, method: str = "POST", data:
         endpoint = endpoint.replace("{customer_id}", customer_id)
     
     # Make the API request
-    result = make_google_ads_request(endpoint, data or {}, method, login_customer_id)
+    result = await make_google_ads_request(endpoint, data or {}, method, login_customer_id)
     
     # Log successful API calls
     if not result.get("error"):
@@ -1254,7 +2026,7 @@ async def api_call(endpoint: str, customer_id: str, method: str = "POST", data:
         # Create a query-like description for logging
         query_description = f"{method.upper()} {endpoint}"
         if data:
-            query_description += f" with data: {json.dumps(data, separators=(',', ':'))[:100]}"
+            query_description += f" with data: {orjson.dumps(data, default=_json_default)[:100].decode(errors='ignore')}"
         
         api_logger.log_success(
             operation_type=operation_type,
@@ -1279,24 +2051,57 @@ async def api_call(endpoint: str, customer_id: str, method: str = "POST", data:
         "error": result.get("error")
     }
 
+def _budget_create_payload(name: str, amount_micros: int, delivery_method: str = "STANDARD") -> dict[str, Any]:
+    """Build the CampaignBudget resource for a create operation"""
+    return {
+        "name": name,
+        "amount_micros": amount_micros,
+        "delivery_method": delivery_method,
+        "period": "DAILY",
+        "explicitly_shared": False  # Required for smart bidding strategies
+    }
+
+def _campaign_create_payload(name: str, budget_resource_name: str,
+                             bidding_strategy_type: str = "MANUAL_CPC",
+                             target_cpa_micros: Optional[int] = None,
+                             target_roas: Optional[float] = None,
+                             status: str = "PAUSED") -> dict[str, Any]:
+    """Build the search Campaign resource for a create operation"""
+    campaign_data = {
+        "name": name,
+        "status": status,
+        "advertising_channel_type": "SEARCH",
+        "campaign_budget": budget_resource_name,
+        "network_settings": {
+            "target_google_search": True,
+            "target_search_network": True,
+            "target_partner_search_network": False,
+            "target_content_network": False
+        },
+        "geo_target_type_setting": {
+            "positive_geo_target_type": "PRESENCE_OR_INTEREST",
+            "negative_geo_target_type": "PRESENCE"
+        }
+    }
+    
+    # Set bidding strategy - supports ALL Google Ads bidding strategies; unknown ones fall back to Manual CPC
+    build = _BIDDING_BUILDERS.get(bidding_strategy_type, _BIDDING_BUILDERS["MANUAL_CPC"])
+    campaign_data.update(build(target_cpa_micros, target_roas))
+    
+    return campaign_data
+
 async def create_campaign_budget(customer_id: str, name: str, amount_micros: int, delivery_method: str = "STANDARD") -> dict[str, Any]:
     """Create a new campaign budget"""
     
     data = {
         "operations": [{
-            "create": {
-                "name": name,
-                "amount_micros": amount_micros,
-                "delivery_method": delivery_method,
-                "period": "DAILY",
-                "explicitly_shared": False  # Required for smart bidding strategies
-            }
+            "create": _budget_create_payload(name, amount_micros, delivery_method)
         }]
     }
     
     # Use ROOT_MCC if accessing child account
     login_customer_id = ROOT_MCC if customer_id != ROOT_MCC else None
-    result = make_google_ads_request(f"customers/{customer_id}/campaignBudgets:mutate", data, "POST", login_customer_id, "budget_creation")
+    result = await make_google_ads_request(f"customers/{customer_id}/campaignBudgets:mutate", data, "POST", login_customer_id, "budget_creation")
     
     # Log successful creations
     if not result.get("error") and result.get("results"):
@@ -1323,70 +2128,15 @@ async def create_campaign_budget(customer_id: str, name: str, amount_micros: int
     }
 
 async def create_campaign(customer_id: str, name: str, budget_resource_name: str, 
-                         bidding_strategy_type: str = "MANUAL_CPC",
+                         bidding_strategy_type: str = "MAXIMIZE_CONVERSIONS",
                          target_cpa_micros: Optional[int] = None,
                          target_roas: Optional[float] = None,
                          geo_target_constants: list = None,
                          status: str = "PAUSED") -> dict[str, Any]:
     """Create a new search campaign"""
     
-    campaign_data = {
-        "name": name,
-        "status": status,
-        "advertising_channel_type": "SEARCH",
-        "campaign_budget": budget_resource_name,
-        "network_settings": {
-            "target_google_search": True,
-            "target_search_network": True,
-            "target_partner_search_network": False,
-            "target_content_network": False
-        },
-        "geo_target_type_setting": {
-            "positive_geo_target_type": "PRESENCE_OR_INTEREST",
-            "negative_geo_target_type": "PRESENCE"
-        }
-    }
-    
-    # Set bidding strategy - supports ALL Google Ads bidding strategies
-    if bidding_strategy_type == "MAXIMIZE_CONVERSIONS":
-        campaign_data["maximize_conversions"] = {}
-        if target_cpa_micros:
-            campaign_data["maximize_conversions"]["target_cpa_micros"] = target_cpa_micros
-    elif bidding_strategy_type == "MAXIMIZE_CONVERSION_VALUE":
-        campaign_data["maximize_conversion_value"] = {}
-        if target_roas:
-            campaign_data["maximize_conversion_value"]["target_roas"] = target_roas
-    elif bidding_strategy_type == "MAXIMIZE_CLICKS":
-        campaign_data["maximize_clicks"] = {}
-        if target_cpa_micros:  # Daily budget cap for max clicks
-            campaign_data["maximize_clicks"]["target_spend_micros"] = target_cpa_micros
-    elif bidding_strategy_type == "TARGET_CPA":
-        campaign_data["target_cpa"] = {"target_cpa_micros": target_cpa_micros or 50000000}
-    elif bidding_strategy_type == "TARGET_ROAS":
-        campaign_data["target_roas"] = {"target_roas": target_roas or 4.0}
-    elif bidding_strategy_type == "TARGET_IMPRESSION_SHARE":
-        campaign_data["target_impression_share"] = {
-            "target_impression_share_micros": int((target_roas or 0.5) * 1000000),  # Use target_roas field for impression share %
-            "cpc_bid_ceiling_micros": target_cpa_micros or 10000000,  # Max CPC bid
-            "location": "SEARCH_PAGE_TOP"  # Default to top of search page
-        }
-    elif bidding_strategy_type == "TARGET_CPM":
-        campaign_data["target_cpm"] = {"target_cpm_micros": target_cpa_micros or 5000000}
-    elif bidding_strategy_type == "TARGET_SPEND":
-        campaign_data["target_spend"] = {"target_spend_micros": target_cpa_micros or 50000000}
-    elif bidding_strategy_type == "MANUAL_CPC":
-        campaign_data["manual_cpc"] = {}
-    elif bidding_strategy_type == "MANUAL_CPM":
-        campaign_data["manual_cpm"] = {}
-    elif bidding_strategy_type == "MANUAL_CPV":
-        campaign_data["manual_cpv"] = {}
-    elif bidding_strategy_type == "COMMISSION":
-        campaign_data["commission"] = {"commission_rate_micros": int((target_roas or 0.05) * 1000000)}  # 5% default
-    elif bidding_strategy_type == "PERCENT_CPC":
-        campaign_data["percent_cpc"] = {"cpc_bid_ceiling_micros": target_cpa_micros or 10000000}
-    else:
-        # Default to Manual CPC if strategy not recognized
-        campaign_data["manual_cpc"] = {}
+    campaign_data = _campaign_create_payload(name, budget_resource_name, bidding_strategy_type,
+                                             target_cpa_micros, target_roas, status)
     
     # Only create the campaign first, location targeting will be done separately
     data = {
@@ -1397,7 +2147,7 @@ async def create_campaign(customer_id: str, name: str, budget_resource_name: str
     
     # Use ROOT_MCC if accessing child account
     login_customer_id = ROOT_MCC if customer_id != ROOT_MCC else None
-    result = make_google_ads_request(f"customers/{customer_id}/campaigns:mutate", data, "POST", login_customer_id, "campaign_creation")
+    result = await make_google_ads_request(f"customers/{customer_id}/campaigns:mutate", data, "POST", login_customer_id, "campaign_creation")
     
     # Log successful creations
     if not result.get("error") and result.get("results"):
@@ -1424,24 +2174,128 @@ async def create_campaign(customer_id: str, name: str, budget_resource_name: str
         "error": result.get("error")
     }
 
+async def google_ads_mutate(customer_id: str, mutate_operations: list, operation_type: str = "google_ads_mutate",
+                            partial_failure: bool = False) -> dict[str, Any]:
+    """Run several resource operations in one GoogleAdsService:mutate call
+    
+    Operations may reference each other through temporary resource names with
+    negative IDs (e.g. customers/{customer_id}/campaignBudgets/-1). Unless
+    partial_failure is set, the request is atomic: one failing operation fails them all.
+    """
+    data = {"mutate_operations": mutate_operations}
+    if partial_failure:
+        data["partial_failure"] = True
+    
+    # Use ROOT_MCC if accessing child account
+    login_customer_id = ROOT_MCC if customer_id != ROOT_MCC else None
+    result = await make_google_ads_request(f"customers/{customer_id}/googleAds:mutate",
+                                           data, "POST", login_customer_id, operation_type)
+    response = {
+        "login_customer_id": login_customer_id,
+        "responses": result.get("mutateOperationResponses", []),
+        "error": result.get("error")
+    }
+    if "partialFailureError" in result:
+        response["partial_failure_error"] = result["partialFailureError"]
+    return response
+
+def _mutate_resource_names(responses: list) -> dict[str, list]:
+    """Group the resource names from GoogleAdsService:mutate responses by result type"""
+    created: dict[str, list] = {}
+    for response in responses:
+        for result_type, value in response.items():
+            created.setdefault(result_type, []).append(value.get("resourceName"))
+    return created
+
+async def create_campaign_with_budget(customer_id: str, campaign_name: str, amount_micros: int,
+                                      budget_name: Optional[str] = None,
+                                      delivery_method: str = "STANDARD",
+                                      bidding_strategy_type: str = "MAXIMIZE_CONVERSIONS",
+                                      target_cpa_micros: Optional[int] = None,
+                                      target_roas: Optional[float] = None,
+                                      status: str = "PAUSED") -> dict[str, Any]:
+    """Create a campaign budget and a search campaign using it in a single round trip"""
+    
+    budget_name = budget_name or f"{campaign_name} Budget"
+    budget_resource_name = f"customers/{customer_id}/campaignBudgets/-1"  # Temporary ID
+    
+    budget_data = _budget_create_payload(budget_name, amount_micros, delivery_method)
+    budget_data["resource_name"] = budget_resource_name
+    campaign_data = _campaign_create_payload(campaign_name, budget_resource_name, bidding_strategy_type,
+                                             target_cpa_micros, target_roas, status)
+    
+    result = await google_ads_mutate(customer_id, [
+        {"campaign_budget_operation": {"create": budget_data}},
+        {"campaign_operation": {"create": campaign_data}}
+    ], "campaign_creation")
+    
+    responses = result["responses"]
+    created = _mutate_resource_names(responses)
+    budget_rn = next(iter(created.get("campaignBudgetResult", ())), None)
+    campaign_rn = next(iter(created.get("campaignResult", ())), None)
+    
+    # Log successful creations
+    if not result.get("error") and campaign_rn:
+        api_logger.log_success(
+            operation_type="campaign_creation",
+            customer_id=customer_id,
+            query=f"CREATE campaign {campaign_name} with budget {budget_name}: {bidding_strategy_type}",
+            result_count=len(responses),
+            context={
+                "name": campaign_name,
+                "bidding_strategy_type": bidding_strategy_type,
+                "amount_micros": amount_micros,
+                "status": status,
+                "login_customer_id": result["login_customer_id"]
+            }
+        )
+    
+    return {
+        "customer_id": customer_id,
+        "campaign_name": campaign_name,
+        "budget_name": budget_name,
+        "bidding_strategy_type": bidding_strategy_type,
+        "status": status,
+        "budget_resource_name": budget_rn,
+        "campaign_resource_name": campaign_rn,
+        "result": responses,
+        "error": result.get("error")
+    }
+
+def _ad_group_create_payload(name: str, campaign_resource_name: str, cpc_bid_micros: int,
+                             status: str = "ENABLED") -> dict[str, Any]:
+    """Build the AdGroup resource for a create operation"""
+    return {
+        "name": name,
+        "status": status,
+        "campaign": campaign_resource_name,
+        "cpc_bid_micros": cpc_bid_micros
+    }
+
+def _keyword_create_payload(ad_group_resource_name: str, keyword: dict) -> dict[str, Any]:
+    """Build the keyword AdGroupCriterion resource for a create operation"""
+    return {
+        "ad_group": ad_group_resource_name,
+        "status": "ENABLED",
+        "keyword": {
+            "text": keyword["text"],
+            "match_type": keyword["match_type"]
+        }
+    }
+
 async def create_ad_group(customer_id: str, campaign_resource_name: str, name: str, 
                          cpc_bid_micros: int, status: str = "ENABLED") -> dict[str, Any]:
     """Create a new ad group"""
     
     data = {
         "operations": [{
-            "create": {
-                "name": name,
-                "status": status,
-                "campaign": campaign_resource_name,
-                "cpc_bid_micros": cpc_bid_micros
-            }
+            "create": _ad_group_create_payload(name, campaign_resource_name, cpc_bid_micros, status)
         }]
     }
     
     # Use ROOT_MCC if accessing child account
     login_customer_id = ROOT_MCC if customer_id != ROOT_MCC else None
-    result = make_google_ads_request(f"customers/{customer_id}/adGroups:mutate", data, "POST", login_customer_id)
+    result = await make_google_ads_request(f"customers/{customer_id}/adGroups:mutate", data, "POST", login_customer_id)
     
     # Log successful creations
     if not result.get("error") and result.get("results"):
@@ -1472,24 +2326,13 @@ async def create_ad_group(customer_id: str, campaign_resource_name: str, name: s
 async def create_keywords(customer_id: str, ad_group_resource_name: str, keywords: list) -> dict[str, Any]:
     """Create keywords in an ad group"""
     
-    operations = []
-    for keyword in keywords:
-        operations.append({
-            "create": {
-                "ad_group": ad_group_resource_name,
-                "status": "ENABLED",
-                "keyword": {
-                    "text": keyword["text"],
-                    "match_type": keyword["match_type"]
-                }
-            }
-        })
+    operations = [{"create": _keyword_create_payload(ad_group_resource_name, keyword)} for keyword in keywords]
     
     data = {"operations": operations}
     
     # Use ROOT_MCC if accessing child account
     login_customer_id = ROOT_MCC if customer_id != ROOT_MCC else None
-    result = make_google_ads_request(f"customers/{customer_id}/adGroupCriteria:mutate", data, "POST", login_customer_id)
+    result = await make_google_ads_request(f"customers/{customer_id}/adGroupCriteria:mutate", data, "POST", login_customer_id)
     
     # Log successful creations
     if not result.get("error") and result.get("results"):
@@ -1513,8 +2356,70 @@ async def create_keywords(customer_id: str, ad_group_resource_name: str, keyword
         "error": result.get("error")
     }
 
+async def create_keywords_bulk(customer_id: str, keyword_sets: list) -> dict[str, Any]:
+    """Create keywords for several ad groups in one atomic adGroupCriteria:mutate request
+    
+    keyword_sets holds {"ad_group_resource_name", "keywords"} entries; the results come back
+    in operation order and are split back out per ad group.
+    """
+    
+    operations = [
+        {"create": _keyword_create_payload(keyword_set["ad_group_resource_name"], keyword)}
+        for keyword_set in keyword_sets for keyword in keyword_set["keywords"]
+    ]
+    
+    data = {"operations": operations}
+    
+    # Use ROOT_MCC if accessing child account
+    login_customer_id = ROOT_MCC if customer_id != ROOT_MCC else None
+    result = await make_google_ads_request(f"customers/{customer_id}/adGroupCriteria:mutate", data, "POST", login_customer_id)
+    results = result.get("results", [])
+    
+    # Log successful creations
+    if not result.get("error") and results:
+        api_logger.log_success(
+            operation_type="keyword_creation",
+            customer_id=customer_id,
+            query=f"CREATE {len(operations)} keywords in {len(keyword_sets)} ad groups",
+            result_count=len(results),
+            context={
+                "ad_group_resource_names": [keyword_set["ad_group_resource_name"] for keyword_set in keyword_sets],
+                "keywords_count": len(operations),
+                "login_customer_id": login_customer_id
+            }
+        )
+    
+    # Several sets may name the same ad group, so their slices are merged
+    results_by_ad_group = {}
+    if results:
+        position = 0
+        for keyword_set in keyword_sets:
+            count = len(keyword_set["keywords"])
+            results_by_ad_group.setdefault(keyword_set["ad_group_resource_name"], []).extend(results[position:position + count])
+            position += count
+    
+    return {
+        "customer_id": customer_id,
+        "ad_groups_count": len(keyword_sets),
+        "keywords_count": len(operations),
+        "results_by_ad_group": results_by_ad_group,
+        "result": results,
+        "error": result.get("error")
+    }
+
 def validate_ad_text(headlines: list, descriptions: list) -> dict[str, list]:
     """Validate headlines and descriptions meet Google Ads character limits with smart fixes"""
+    # Fast path: nothing to fix, so skip building any error text
+    if (len(headlines) >= 3 and len(descriptions) >= 2
+            and max(map(len, headlines)) <= 30 and max(map(len, descriptions)) <= 90):
+        return {
+            "valid": True,
+            "errors": [],
+            "fixed_headlines": list(headlines),
+            "fixed_descriptions": list(descriptions),
+            "auto_fixed": False
+        }
+    
     errors = []
     fixed_headlines = []
     fixed_descriptions = []
@@ -1554,10 +2459,61 @@ def validate_ad_text(headlines: list, descriptions: list) -> dict[str, list]:
         "auto_fixed": len(errors) > 0
     }
 
+def _responsive_search_ad_create_payload(ad_group_resource_name: str, headlines: list, descriptions: list,
+                                         final_urls: list, path1: Optional[str] = None,
+                                         path2: Optional[str] = None) -> dict[str, Any]:
+    """Build the responsive search AdGroupAd resource for a create operation (text already validated)"""
+    ad_data = {
+        "ad_group": ad_group_resource_name,
+        "status": "ENABLED",
+        "ad": {
+            "final_urls": final_urls,
+            "responsive_search_ad": {
+                "headlines": [{"text": headline} for headline in headlines],
+                "descriptions": [{"text": description} for description in descriptions]
+            }
+        }
+    }
+    
+    if path1:
+        ad_data["ad"]["responsive_search_ad"]["path1"] = path1
+    if path2:
+        ad_data["ad"]["responsive_search_ad"]["path2"] = path2
+    
+    return ad_data
+
 async def create_responsive_search_ad(customer_id: str, ad_group_resource_name: str, 
                                      headlines: list, descriptions: list, final_urls: list,
-                                     path1: Optional[str] = None, path2: Optional[str] = None) -> dict[str, Any]:
-    """Create a responsive search ad with smart text validation and auto-fixing"""
+                                     path1: Optional[str] = None, path2: Optional[str] = None,
+                                     validate_only: bool = False) -> dict[str, Any]:
+    """Create a responsive search ad with smart text validation and auto-fixing
+
+    With validate_only, the text exactly as supplied is sent with validate_only set so Google Ads
+    checks it against its current limits without creating it; local auto-fixes are only reported.
+    """
+    
+    # Use ROOT_MCC if accessing child account
+    login_customer_id = ROOT_MCC if customer_id != ROOT_MCC else None
+    
+    if validate_only:
+        ad_data = _responsive_search_ad_create_payload(ad_group_resource_name, headlines, descriptions,
+                                                       final_urls, path1, path2)
+        data = {"operations": [{"create": ad_data}], "validate_only": True}
+        result = await make_google_ads_request(f"customers/{customer_id}/adGroupAds:mutate", data, "POST", login_customer_id, "ad_validation")
+        local_validation = validate_ad_text(headlines, descriptions)
+        return {
+            "customer_id": customer_id,
+            "ad_group_resource_name": ad_group_resource_name,
+            "valid": not result.get("error"),
+            "errors": [result["error"]] if result.get("error") else [],
+            "headlines": headlines,
+            "descriptions": descriptions,
+            # What a real create would have changed before sending
+            "local_fixes": {
+                "auto_fixed": local_validation["auto_fixed"],
+                "fixes_applied": local_validation["errors"]
+            }
+        }
     
     # Validate and auto-fix text length issues
     validation = validate_ad_text(headlines, descriptions)
@@ -1572,22 +2528,8 @@ async def create_responsive_search_ad(customer_id: str, ad_group_resource_name:
         "fixes_applied": validation.get("errors", [])
     }
     
-    ad_data = {
-        "ad_group": ad_group_resource_name,
-        "status": "ENABLED",
-        "ad": {
-            "final_urls": final_urls,
-            "responsive_search_ad": {
-                "headlines": [{"text": headline} for headline in final_headlines],
-                "descriptions": [{"text": description} for description in final_descriptions]
-            }
-        }
-    }
-    
-    if path1:
-        ad_data["ad"]["responsive_search_ad"]["path1"] = path1
-    if path2:
-        ad_data["ad"]["responsive_search_ad"]["path2"] = path2
+    ad_data = _responsive_search_ad_create_payload(ad_group_resource_name, final_headlines, final_descriptions,
+                                                   final_urls, path1, path2)
     
     data = {
         "operations": [{
@@ -1595,9 +2537,7 @@ async def create_responsive_search_ad(customer_id: str, ad_group_resource_name:
         }]
     }
     
-    # Use ROOT_MCC if accessing child account
-    login_customer_id = ROOT_MCC if customer_id != ROOT_MCC else None
-    result = make_google_ads_request(f"customers/{customer_id}/adGroupAds:mutate", data, "POST", login_customer_id, "ad_creation")
+    result = await make_google_ads_request(f"customers/{customer_id}/adGroupAds:mutate", data, "POST", login_customer_id, "ad_creation")
     
     # Log successful creations
     if not result.get("error") and result.get("results"):
@@ -1645,6 +2585,153 @@ async def create_responsive_search_ad(customer_id: str, ad_group_resource_name:
     
     return response_data
 
+def _ad_group_tree_operations(ad_group_resource_name: str, campaign_resource_name: str, name: str,
+                              cpc_bid_micros: int, status: str, keywords: list, headlines: list,
+                              descriptions: list, final_urls: list, path1: Optional[str] = None,
+                              path2: Optional[str] = None) -> tuple[list, dict]:
+    """MutateOperations creating an ad group under a temporary resource name, its keywords and one RSA
+    
+    Returns the operations and the validate_ad_text report for the ad text.
+    """
+    ad_group_data = _ad_group_create_payload(name, campaign_resource_name, cpc_bid_micros, status)
+    ad_group_data["resource_name"] = ad_group_resource_name
+    
+    # Same auto-fixing as create_responsive_search_ad
+    validation = validate_ad_text(headlines, descriptions)
+    ad_data = _responsive_search_ad_create_payload(ad_group_resource_name, validation["fixed_headlines"],
+                                                   validation["fixed_descriptions"], final_urls, path1, path2)
+    
+    operations = [
+        {"ad_group_operation": {"create": ad_group_data}},
+        *({"ad_group_criterion_operation": {"create": _keyword_create_payload(ad_group_resource_name, keyword)}}
+          for keyword in keywords),
+        {"ad_group_ad_operation": {"create": ad_data}}
+    ]
+    return operations, validation
+
+async def create_ad_group_tree(customer_id: str, campaign_resource_name: str, name: str, cpc_bid_micros: int,
+                               keywords: list, headlines: list, descriptions: list, final_urls: list,
+                               status: str = "ENABLED", path1: Optional[str] = None,
+                               path2: Optional[str] = None) -> dict[str, Any]:
+    """Create an ad group with its keywords and a responsive search ad in one atomic mutate"""
+    
+    ad_group_resource_name = f"customers/{customer_id}/adGroups/-1"  # Temporary ID
+    mutate_operations, validation = _ad_group_tree_operations(
+        ad_group_resource_name, campaign_resource_name, name, cpc_bid_micros, status,
+        keywords, headlines, descriptions, final_urls, path1, path2
+    )
+    
+    result = await google_ads_mutate(customer_id, mutate_operations, "ad_group_creation")
+    created = _mutate_resource_names(result["responses"])
+    
+    # Log successful creations
+    if not result.get("error") and created.get("adGroupResult"):
+        api_logger.log_success(
+            operation_type="ad_group_creation",
+            customer_id=customer_id,
+            query=f"CREATE ad_group {name} with {len(keywords)} keywords and 1 ad: {cpc_bid_micros} micros",
+            result_count=len(result["responses"]),
+            context={
+                "name": name,
+                "campaign_resource_name": campaign_resource_name,
+                "cpc_bid_micros": cpc_bid_micros,
+                "keywords_count": len(keywords),
+                "status": status,
+                "login_customer_id": result["login_customer_id"]
+            }
+        )
+    
+    return {
+        "customer_id": customer_id,
+        "ad_group_name": name,
+        "campaign_resource_name": campaign_resource_name,
+        "cpc_bid_micros": cpc_bid_micros,
+        "status": status,
+        "validation": {
+            "auto_fixed": validation["auto_fixed"],
+            "fixes_applied": validation["errors"]
+        },
+        "ad_group_resource_name": next(iter(created.get("adGroupResult", ())), None),
+        "keyword_resource_names": created.get("adGroupCriterionResult", []),
+        "ad_resource_name": next(iter(created.get("adGroupAdResult", ())), None),
+        "result": result["responses"],
+        "error": result.get("error")
+    }
+
+async def create_full_campaign(customer_id: str, campaign_name: str, amount_micros: int,
+                               ad_group_name: str, cpc_bid_micros: int, keywords: list,
+                               headlines: list, descriptions: list, final_urls: list,
+                               budget_name: Optional[str] = None,
+                               bidding_strategy_type: str = "MAXIMIZE_CONVERSIONS",
+                               target_cpa_micros: Optional[int] = None,
+                               target_roas: Optional[float] = None,
+                               status: str = "PAUSED",
+                               path1: Optional[str] = None, path2: Optional[str] = None) -> dict[str, Any]:
+    """Create budget, campaign, ad group, keywords and a responsive search ad in one atomic mutate"""
+    
+    budget_name = budget_name or f"{campaign_name} Budget"
+    # Temporary IDs let later operations reference resources created earlier in the same request
+    budget_resource_name = f"customers/{customer_id}/campaignBudgets/-1"
+    campaign_resource_name = f"customers/{customer_id}/campaigns/-2"
+    ad_group_resource_name = f"customers/{customer_id}/adGroups/-3"
+    
+    budget_data = _budget_create_payload(budget_name, amount_micros)
+    budget_data["resource_name"] = budget_resource_name
+    campaign_data = _campaign_create_payload(campaign_name, budget_resource_name, bidding_strategy_type,
+                                             target_cpa_micros, target_roas, status)
+    campaign_data["resource_name"] = campaign_resource_name
+    tree_operations, validation = _ad_group_tree_operations(
+        ad_group_resource_name, campaign_resource_name, ad_group_name, cpc_bid_micros, "ENABLED",
+        keywords, headlines, descriptions, final_urls, path1, path2
+    )
+    
+    mutate_operations = [
+        {"campaign_budget_operation": {"create": budget_data}},
+        {"campaign_operation": {"create": campaign_data}},
+        *tree_operations
+    ]
+    
+    result = await google_ads_mutate(customer_id, mutate_operations, "campaign_creation")
+    created = _mutate_resource_names(result["responses"])
+    
+    # Log successful creations
+    if not result.get("error") and created.get("campaignResult"):
+        api_logger.log_success(
+            operation_type="campaign_creation",
+            customer_id=customer_id,
+            query=f"CREATE full campaign {campaign_name}: {bidding_strategy_type}, {len(keywords)} keywords",
+            result_count=len(result["responses"]),
+            context={
+                "name": campaign_name,
+                "bidding_strategy_type": bidding_strategy_type,
+                "amount_micros": amount_micros,
+                "ad_group_name": ad_group_name,
+                "keywords_count": len(keywords),
+                "status": status,
+                "login_customer_id": result["login_customer_id"]
+            }
+        )
+    
+    return {
+        "customer_id": customer_id,
+        "campaign_name": campaign_name,
+        "budget_name": budget_name,
+        "ad_group_name": ad_group_name,
+        "bidding_strategy_type": bidding_strategy_type,
+        "status": status,
+        "validation": {
+            "auto_fixed": validation["auto_fixed"],
+            "fixes_applied": validation["errors"]
+        },
+        "budget_resource_name": next(iter(created.get("campaignBudgetResult", ())), None),
+        "campaign_resource_name": next(iter(created.get("campaignResult", ())), None),
+        "ad_group_resource_name": next(iter(created.get("adGroupResult", ())), None),
+        "keyword_resource_names": created.get("adGroupCriterionResult", []),
+        "ad_resource_name": next(iter(created.get("adGroupAdResult", ())), None),
+        "result": result["responses"],
+        "error": result.get("error")
+    }
+
 async def create_ad_like_successful_pattern(customer_id: str, ad_group_resource_name: str, business_name: str = "BizExplorer") -> dict[str, Any]:
     """Create a responsive search ad using the exact successful pattern from API log"""
     
@@ -1741,6 +2828,50 @@ async def get_smart_recommendations(customer_id: str, goal: str, context: str =
         ]
     }
 
+# Operation phrase -> endpoint, in match priority order. Every mapped operation is a POST.
+_OPERATION_PATHS: dict[str, str] = {
+    "create campaign": "campaigns:mutate",
+    "create ad group": "adGroups:mutate",
+    "create keywords": "adGroupCriteria:mutate",
+    "create ads": "adGroupAds:mutate",
+    "create budget": "campaignBudgets:mutate",
+    "create conversion": "conversionActions:mutate",
+    "update campaign": "campaigns:mutate",
+    "pause campaign": "campaigns:mutate",
+    "add negative keywords": "campaignCriteria:mutate",
+    "create audience": "customAudiences:mutate",
+    "create extension": "extensionFeedItems:mutate",
+    "upload conversions": "conversionUploads:uploadClickConversions",
+    "create shopping campaign": "campaigns:mutate",
+    "create performance max": "campaigns:mutate",
+    "create display campaign": "campaigns:mutate"
+}
+
+# One read-only endpoint entry per distinct path, shared by every phrase that maps to it
+_OPERATION_ENDPOINTS = {
+    path: MappingProxyType({"endpoint": path, "method": "POST"}) for path in dict.fromkeys(_OPERATION_PATHS.values())
+}
+_OPERATION_MAPPING: dict[str, MappingProxyType] = {
+    phrase: _OPERATION_ENDPOINTS[path] for phrase, path in _OPERATION_PATHS.items()
+}
+
+# Phrase -> its position in _OPERATION_MAPPING, matched in a single pass when pyahocorasick is installed
+_OPERATION_ENTRIES = list(_OPERATION_MAPPING.values())
+if ahocorasick is not None:
+    _OPERATION_AUTOMATON = ahocorasick.Automaton()
+    for priority, operation_key in enumerate(_OPERATION_MAPPING):
+        _OPERATION_AUTOMATON.add_word(operation_key, priority)
+    _OPERATION_AUTOMATON.make_automaton()
+else:
+    _OPERATION_AUTOMATON = None
+
+def _match_operation(operation_lower: str) -> Optional[MappingProxyType]:
+    """Endpoint info for the first _OPERATION_MAPPING phrase found in the description"""
+    if _OPERATION_AUTOMATON is None:
+        return next((info for key, info in _OPERATION_MAPPING.items() if key in operation_lower), None)
+    priorities = [priority for _, priority in _OPERATION_AUTOMATON.iter(operation_lower)]
+    return _OPERATION_ENTRIES[min(priorities)] if priorities else None
+
 async def execute_any_operation(customer_id: str, operation_description: str, parameters: dict = None) -> dict[str, Any]:
     """Execute ANY Google Ads API operation with intelligent assistance"""
     
@@ -1750,31 +2881,8 @@ async def execute_any_operation(customer_id: str, operation_description: str, pa
     # Parse the operation description to determine intent
     operation_lower = operation_description.lower()
     
-    # Map common operations to API endpoints
-    operation_mapping = {
-        "create campaign": {"endpoint": "campaigns:mutate", "method": "POST"},
-        "create ad group": {"endpoint": "adGroups:mutate", "method": "POST"},
-        "create keywords": {"endpoint": "adGroupCriteria:mutate", "method": "POST"},
-        "create ads": {"endpoint": "adGroupAds:mutate", "method": "POST"},
-        "create budget": {"endpoint": "campaignBudgets:mutate", "method": "POST"},
-        "create conversion": {"endpoint": "conversionActions:mutate", "method": "POST"},
-        "update campaign": {"endpoint": "campaigns:mutate", "method": "POST"},
-        "pause campaign": {"endpoint": "campaigns:mutate", "method": "POST"},
-        "add negative keywords": {"endpoint": "campaignCriteria:mutate", "method": "POST"},
-        "create audience": {"endpoint": "customAudiences:mutate", "method": "POST"},
-        "create extension": {"endpoint": "extensionFeedItems:mutate", "method": "POST"},
-        "upload conversions": {"endpoint": "conversionUploads:uploadClickConversions", "method": "POST"},
-        "create shopping campaign": {"endpoint": "campaigns:mutate", "method": "POST"},
-        "create performance max": {"endpoint": "campaigns:mutate", "method": "POST"},
-        "create display campaign": {"endpoint": "campaigns:mutate", "method": "POST"}
-    }
-    
     # Determine the API endpoint
-    endpoint_info = None
-    for operation_key, endpoint_data in operation_mapping.items():
-        if operation_key in operation_lower:
-            endpoint_info = endpoint_data
-            break
+    endpoint_info = _match_operation(operation_lower)
     
     if not endpoint_info:
         # Default to generic api_call for any unrecognized operation
@@ -1791,26 +2899,17 @@ async def execute_any_operation(customer_id: str, operation_description: str, pa
     # Generate intelligent operation data based on common patterns
     if "create campaign" in operation_lower:
         # Smart campaign creation with reasonable defaults
-        budget_name = parameters.get("budget_name", f"Auto Budget {datetime.now().strftime('%Y%m%d_%H%M%S')}")
-        campaign_name = parameters.get("campaign_name", f"Auto Campaign {datetime.now().strftime('%Y%m%d_%H%M%S')}")
-        
-        # First create budget if needed
-        budget_result = await create_campaign_budget(
-            customer_id=customer_id,
-            name=budget_name,
-            amount_micros=parameters.get("budget_micros", 50000000)  # Default $50/day
-        )
-        
-        if budget_result.get("error"):
-            return budget_result
-            
-        budget_rn = budget_result["result"][0]["resourceName"]
+        # One timestamp for both default names, so the pair is easy to match up
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        budget_name = parameters.get("budget_name", f"Auto Budget {timestamp}")
+        campaign_name = parameters.get("campaign_name", f"Auto Campaign {timestamp}")
         
-        # Then create campaign
-        return await create_campaign(
+        # Budget and campaign go out together in one atomic mutate
+        return await create_campaign_with_budget(
             customer_id=customer_id,
-            name=campaign_name,
-            budget_resource_name=budget_rn,
+            campaign_name=campaign_name,
+            amount_micros=parameters.get("budget_micros", 50000000),  # Default $50/day
+            budget_name=budget_name,
             bidding_strategy_type=parameters.get("bidding_strategy", "MANUAL_CPC"),
             target_cpa_micros=parameters.get("target_cpa_micros"),
             target_roas=parameters.get("target_roas"),
@@ -1851,10 +2950,148 @@ async def execute_any_operation(customer_id: str, operation_description: str, pa
             data=parameters
         )
 
+V20_DOCS_PATH = Path("/mnt/c/Users/willi/OneDrive/Desktop/aio-v2/.ai/.docs/v20api")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+class _ProtoIndex:
+    """Inverted index over the v20 proto files, pickled next to them and rebuilt when a proto changes
+    
+    Every line of every proto is kept in memory, and each lowercase alphanumeric token
+    maps to the global numbers of the lines containing it. A substring search
+    then only checks lines holding a token that contains the term's longest token.
+    """
+    
+    def __init__(self, proto_path: Path):
+        self.proto_path = proto_path
+        self.index_file = proto_path / ".index.pkl"
+        self._load_lock = threading.Lock()  # Concurrent first searches run in worker threads
+        self._loaded = False
+        self.files: List[str] = []  # Proto paths, in rglob order
+        self.lines: List[tuple[int, int, str]] = []  # (file number, line number, text) in file/line order
+        self.file_lines: List[List[str]] = []  # All lines of each file, for match context
+        self.tokens: Dict[str, List[int]] = {}  # token -> line numbers into self.lines
+    
+    def _load(self):
+        """Load the pickled index if it is current, otherwise rebuild and save it"""
+        paths = list(self.proto_path.rglob("*.proto"))
+        newest = max((path.stat().st_mtime for path in paths), default=0)
+        try:
+            if self.index_file.stat().st_mtime >= newest:
+                with open(self.index_file, "rb") as f:
+                    self.files, self.lines, self.file_lines, self.tokens = pickle.load(f)
+                self._loaded = True
+                return
+        except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+            pass
+        self._build(paths)
+        try:
+            with open(self.index_file, "wb") as f:
+                pickle.dump((self.files, self.lines, self.file_lines, self.tokens), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # Read-only docs directory: keep the in-memory index
+        self._loaded = True
+    
+    def _build(self, paths: List[Path]):
+        tokens: Dict[str, List[int]] = defaultdict(list)
+        for path in paths:
+            try:
+                content = path.read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+            file_no = len(self.files)
+            self.files.append(str(path))
+            file_lines = content.split("\n")
+            self.file_lines.append(file_lines)
+            for line_no, line in enumerate(file_lines):
+                line_id = len(self.lines)
+                self.lines.append((file_no, line_no, line))
+                for token in set(_TOKEN_RE.findall(line.lower())):
+                    tokens[token].append(line_id)
+        self.tokens = dict(tokens)
+    
+    def _candidates(self, term: str) -> set:
+        """Line numbers that may contain term as a substring"""
+        term_tokens = _TOKEN_RE.findall(term)
+        if not term_tokens:
+            return set(range(len(self.lines)))
+        needle = max(term_tokens, key=len)
+        return {line_id for token, ids in self.tokens.items() if needle in token for line_id in ids}
+    
+    def search(self, search_terms: List[str], limit: int) -> List[Dict]:
+        """The first limit lines containing any term, with three lines of context either side"""
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self._load()
+        candidates = set()
+        for term in search_terms:
+            candidates |= self._candidates(term)
+        
+        # Pop candidates in file/line order from a heap, so a common term that hits
+        # thousands of lines stops after the first few matches instead of sorting them all
+        heap = list(candidates)
+        heapq.heapify(heap)
+        sections = []
+        while heap:
+            line_id = heapq.heappop(heap)
+            file_no, line_no, line = self.lines[line_id]
+            line_lower = line.lower()
+            term = next((term for term in search_terms if term in line_lower), None)
+            if term is None:
+                continue
+            file_lines = self.file_lines[file_no]
+            sections.append({
+                "file": self.files[file_no],
+                "type": "proto_definition",
+                "matched_term": term,
+                "context": "\n".join(file_lines[max(0, line_no - 3):line_no + 4]),
+                "line_number": line_no + 1
+            })
+            if len(sections) == limit:
+                break
+        return sections
+
+_PROTO_INDEX = _ProtoIndex(V20_DOCS_PATH / "google_ads_v20_docs" / "protos")
+_V20_DOCS_CACHE = _TTLCache(maxsize=256)  # lookup_v20_docs hits by lowercased query; the docs are static
+# Queries that matched nothing; kept briefly so repeated misses skip the scan but newly added docs still show up
+_V20_DOCS_MISSES = _TTLCache(maxsize=256, ttl=60)
+
+def _scan_v20_docs(docs_path: Path, search_terms: List[str]) -> tuple[List[Dict], List[Dict]]:
+    """Search the HTML file names and the proto index for any of the terms"""
+    found_docs = []
+    relevant_sections = []
+    
+    # Search HTML documentation with expanded terms
+    html_path = docs_path / "google_ads_v20_docs" / "html"
+    if html_path.exists():
+        for html_file in html_path.glob("*.html"):
+            for term in search_terms:
+                if term in html_file.name.lower():
+                    found_docs.append({
+                        "file": str(html_file),
+                        "type": "service_reference",
+                        "service": html_file.stem,
+                        "matched_term": term,
+                        "relevance": "high" if term == search_terms[0] else "medium"
+                    })
+                    break
+    
+    # Search proto files for field definitions with context
+    if _PROTO_INDEX.proto_path.exists():
+        relevant_sections = _PROTO_INDEX.search(search_terms, 10)
+    
+    return found_docs, relevant_sections
+
 async def lookup_v20_docs(query: str) -> dict[str, Any]:
     """Enhanced lookup for Google Ads API v20 documentation with intelligent search"""
     
-    docs_path = Path("/mnt/c/Users/willi/OneDrive/Desktop/aio-v2/.ai/.docs/v20api")
+    # The search itself is case-insensitive, so differently cased queries share an entry
+    key = query.lower()
+    cached = _V20_DOCS_CACHE.get(key) or _V20_DOCS_MISSES.get(key)
+    if cached is not None:
+        return dict(cached, query=query)
+    
+    docs_path = V20_DOCS_PATH
     
     # Intelligent query expansion for better results
     search_terms = [query.lower()]
@@ -1874,53 +3111,9 @@ async def lookup_v20_docs(query: str) -> dict[str, Any]:
         if operation in query.lower():
             search_terms.extend(terms)
     
-    # Search through documentation files
-    found_docs = []
-    relevant_sections = []
-    
     try:
-        # Search HTML documentation with expanded terms
-        html_path = docs_path / "google_ads_v20_docs" / "html"
-        if html_path.exists():
-            for html_file in html_path.glob("*.html"):
-                for term in search_terms:
-                    if term in html_file.name.lower():
-                        found_docs.append({
-                            "file": str(html_file),
-                            "type": "service_reference",
-                            "service": html_file.stem,
-                            "matched_term": term,
-                            "relevance": "high" if term == search_terms[0] else "medium"
-                        })
-                        break
-
-        # Search proto files for field definitions with context
-        proto_path = docs_path / "google_ads_v20_docs" / "protos"
-        if proto_path.exists():
-            for proto_file in proto_path.rglob("*.proto"):
-                try:
-                    with open(proto_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        lines = content.split('\n')
-                        
-                        for i, line in enumerate(lines):
-                            for term in search_terms:
-                                if term in line.lower():
-                                    # Get context around the match
-                                    start = max(0, i - 3)
-                                    end = min(len(lines), i + 4)
-                                    context = '\n'.join(lines[start:end])
-                                    
-                                    relevant_sections.append({
-                                        "file": str(proto_file),
-                                        "type": "proto_definition", 
-                                        "matched_term": term,
-                                        "context": context,
-                                        "line_number": i + 1
-                                    })
-                                    break
-                except:
-                    continue
+        # The directory walk and proto scan are blocking, so run them off the event loop
+        found_docs, relevant_sections = await asyncio.to_thread(_scan_v20_docs, docs_path, search_terms)
 
         # Smart suggestions based on what we found
         suggestions = []
@@ -1931,7 +3124,7 @@ async def lookup_v20_docs(query: str) -> dict[str, Any]:
         if "budget" in str(found_docs).lower():
             suggestions.append("Use campaignBudgets:mutate for budget operations")
 
-        return {
+        result = {
             "query": query,
             "search_terms_used": search_terms,
             "found_docs": found_docs[:5],  # Top 5 file matches
@@ -1944,6 +3137,8 @@ async def lookup_v20_docs(query: str) -> dict[str, Any]:
                 "Check the service reference for endpoint details"
             ]
         }
+        (_V20_DOCS_CACHE if result["docs_available"] else _V20_DOCS_MISSES).set(key, result)
+        return dict(result)
         
     except Exception as e:
         return {
@@ -1953,22 +3148,56 @@ async def lookup_v20_docs(query: str) -> dict[str, Any]:
             "fallback_suggestion": "Try using the api_call function with the specific endpoint you need"
         }
 
+# Tool name -> coroutine implementing it, keyed like the _TOOLS definitions
+TOOL_HANDLERS: dict[str, Callable[..., Awaitable[dict[str, Any]]]] = {
+    "search_campaigns": search_campaigns,
+    "run_gaql": run_gaql,
+    "get_account_info": get_account_info,
+    "mutate_campaign": mutate_campaign,
+    "lookup_docs": lookup_docs,
+    "get_ai_context": get_ai_context,
+    "api_call": api_call,
+    "create_campaign_budget": create_campaign_budget,
+    "create_campaign": create_campaign,
+    "create_ad_group": create_ad_group,
+    "create_keywords": create_keywords,
+    "create_keywords_bulk": create_keywords_bulk,
+    "create_responsive_search_ad": create_responsive_search_ad,
+    "create_ad_like_successful_pattern": create_ad_like_successful_pattern,
+    "get_smart_recommendations": get_smart_recommendations,
+    "execute_any_operation": execute_any_operation,
+    "create_campaign_with_budget": create_campaign_with_budget,
+    "create_full_campaign": create_full_campaign,
+    "create_ad_group_tree": create_ad_group_tree,
+}
+
+# Keyword arguments each handler accepts, so unknown client-supplied keys are dropped
+_HANDLER_PARAMETERS: dict[str, frozenset[str]] = {
+    name: frozenset(inspect.signature(handler).parameters) for name, handler in TOOL_HANDLERS.items()
+}
+
 async def main():
     """Main entry point for the MCP server"""
+    # Open the connection pool up front so the first tool call doesn't pay for it
+    _get_http_session()
+    
     # Run the server using stdin/stdout streams
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="google-ads-mcp",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="google-ads-mcp",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        await close_http_session()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -4,55 +4,166 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import gzip
 import html
-import json
+import inspect
 import pathlib
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
 import aiohttp
+import orjson
 import pandas as pd
 from bs4 import BeautifulSoup
 from google.ads.googleads.client import GoogleAdsClient
 from google.ads.googleads.errors import GoogleAdsException
-from tenacity import retry, stop_after_attempt, wait_random_exponential
+from google.protobuf import json_format
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+try:
+    from selectolax.parser import HTMLParser  # Optional: much faster <main> extraction than bs4
+except ImportError:
+    HTMLParser = None
 
 DOC_CACHE = pathlib.Path(__file__).parent / "docs_cache"
 DOC_CACHE.mkdir(parents=True, exist_ok=True)
 DOC_BASE_URL = "https://developers.google.com/google-ads/api/reference/rpc/v20"
+DOC_CACHE_COMPRESSLEVEL = 5  # Reference HTML shrinks ~10x; higher levels barely help
+DOC_SNIPPET_CACHE_SIZE = 512  # Parsed <main> snippets kept in memory
+ACCESSIBLE_CUSTOMERS_TTL = 300  # Seconds the accessible-customers list is reused
+GAQL_STREAM_QUEUE = 4  # Row batches buffered between the stream thread and stdout
+GAQL_STREAM_PUT_POLL = 0.5  # Seconds a stream thread waits for queue space before checking the consumer is still there
+GAQL_WORKERS = 32  # Threads for blocking Google Ads calls; parallel GAQL fans out one per account
 
 
 def _send(msg: Dict[str, Any]):
-    sys.stdout.write(json.dumps(msg, ensure_ascii=False) + "\n")
-    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(msg) + b"\n")
+    sys.stdout.buffer.flush()
 
 
 def _client() -> GoogleAdsClient:
-    return GoogleAdsClient.load_from_storage()
+    client = GoogleAdsClient.load_from_storage()
+    # Return raw protobuf messages; proto-plus wrapping is slow on large GAQL results
+    client.use_proto_plus = False
+    return client
+
+
+# Same row format proto-plus to_json() produced: enums as integers, default-valued fields kept.
+# protobuf 5.26 renamed including_default_value_fields to always_print_fields_with_no_presence.
+if "always_print_fields_with_no_presence" in inspect.signature(json_format.MessageToDict).parameters:
+    _ROW_FORMAT = {"use_integers_for_enums": True, "always_print_fields_with_no_presence": True}
+else:
+    _ROW_FORMAT = {"use_integers_for_enums": True, "including_default_value_fields": True}
+
+
+def _row_dict(row) -> Dict[str, Any]:
+    # Shared by run_gaql and run_gaql_stream so both return the same row format
+    return json_format.MessageToDict(row, **_ROW_FORMAT)
+
+
+_SESSION: aiohttp.ClientSession | None = None
+
+
+def _session() -> aiohttp.ClientSession:
+    # One pooled session keeps the connection to the docs host alive between fetches
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession(raise_for_status=True, timeout=aiohttp.ClientTimeout(total=60))
+    return _SESSION
 
 
 async def _fetch(url: str) -> str:
-    async with aiohttp.ClientSession(raise_for_status=True) as sess:
-        async with sess.get(url, timeout=60) as r:
-            return await r.text()
+    async with _session().get(url) as r:
+        return await r.text()
+
+
+def _read_cached(service: str) -> str:
+    try:
+        return gzip.decompress((DOC_CACHE / f"{service}.html.gz").read_bytes()).decode("utf-8")
+    except FileNotFoundError:
+        # Pages cached before compression was added
+        return (DOC_CACHE / f"{service}.html").read_text("utf-8")
 
 
-def _doc_html(service: str) -> str:
-    cached = DOC_CACHE / f"{service}.html"
-    if cached.exists():
-        return cached.read_text("utf-8")
-    html_txt = asyncio.run(_fetch(f"{DOC_BASE_URL}/{service}"))
-    cached.write_text(html_txt, "utf-8")
+def _write_cached(service: str, html_txt: str):
+    data = gzip.compress(html_txt.encode("utf-8"), compresslevel=DOC_CACHE_COMPRESSLEVEL)
+    (DOC_CACHE / f"{service}.html.gz").write_bytes(data)
+
+
+async def _doc_html(service: str) -> str:
+    try:
+        return await asyncio.to_thread(_read_cached, service)
+    except FileNotFoundError:
+        pass
+    html_txt = await _fetch(f"{DOC_BASE_URL}/{service}")
+    await asyncio.to_thread(_write_cached, service, html_txt)
     return html_txt
 
 
-def _doc_snippet(service: str) -> str:
-    soup = BeautifulSoup(_doc_html(service), "html.parser")
+def _main_snippet(html_txt: str) -> str:
+    if HTMLParser is not None:
+        tree = HTMLParser(html_txt)
+        node = tree.css_first("main") or tree.body
+        return (node.html if node is not None else html_txt)[:16000]
+    soup = BeautifulSoup(html_txt, "html.parser")
     body = soup.find("main") or soup
     return str(body)[:16000]
 
 
-@retry(wait=wait_random_exponential(min=1, max=30), stop=stop_after_attempt(4))
+@functools.lru_cache(maxsize=DOC_SNIPPET_CACHE_SIZE)
+def _parsed_snippet(service: str, mtime_ns: int) -> str:
+    # mtime_ns is only part of the key, so a re-fetched page is parsed again
+    return _main_snippet(_read_cached(service))
+
+
+def _cached_snippet(service: str) -> str:
+    """Snippet of a page already in docs_cache; FileNotFoundError if it is not"""
+    path = DOC_CACHE / f"{service}.html.gz"
+    if not path.exists():
+        path = DOC_CACHE / f"{service}.html"
+    return _parsed_snippet(service, path.stat().st_mtime_ns)
+
+
+async def _doc_snippet(service: str) -> str:
+    # Parsing is CPU-bound, so keep it off the loop as well
+    try:
+        return await asyncio.to_thread(_cached_snippet, service)
+    except FileNotFoundError:
+        pass
+    return await asyncio.to_thread(_main_snippet, await _doc_html(service))
+
+
+# login customer ID -> (monotonic fetch time, accessible customer IDs)
+_ACCESSIBLE_CACHE: Dict[str, tuple[float, List[str]]] = {}
+
+
+def _accessible_customers(client: GoogleAdsClient) -> List[str]:
+    key = str(client.login_customer_id or "")
+    cached = _ACCESSIBLE_CACHE.get(key)
+    now = time.monotonic()
+    if cached and now - cached[0] < ACCESSIBLE_CUSTOMERS_TTL:
+        return cached[1]
+    try:
+        cust_svc = client.get_service("CustomerService")
+        subs = [n.split("/")[-1] for n in cust_svc.list_accessible_customers().resource_names]
+    except GoogleAdsException:
+        if cached:
+            return cached[1]  # A stale list beats failing the whole fan-out
+        raise
+    _ACCESSIBLE_CACHE[key] = (now, subs)
+    return subs
+
+
+def _gaql_retrying(**kwargs) -> AsyncRetrying:
+    # Backoff sleeps happen on the event loop, so a retrying account does not hold a worker thread.
+    # reraise keeps the last GoogleAdsException for _dispatch instead of a RetryError.
+    return AsyncRetrying(wait=wait_random_exponential(min=1, max=30), stop=stop_after_attempt(4), reraise=True, **kwargs)
+
+
 def _gaql_stream(client: GoogleAdsClient, cid: str, q: str):
     svc = client.get_service("GoogleAdsService")
     return svc.search_stream(customer_id=cid, query=q)
@@ -61,19 +172,71 @@ def _gaql_stream(client: GoogleAdsClient, cid: str, q: str):
 async def _run_gaql(customer_id: str, gaql: str, parallel: bool = False):
     client = _client()
 
+    def _rows(cid: str):
+        return [_row_dict(row) for resp in _gaql_stream(client, cid, gaql) for row in resp.results]
+
     async def _run(cid: str):
-        rows = [row for resp in _gaql_stream(client, cid, gaql) for row in resp.results]
-        return [json.loads(row.to_json()) for row in rows]
+        # Each attempt reads the whole stream, so errors mid-stream are retried as well
+        async for attempt in _gaql_retrying():
+            with attempt:
+                return await asyncio.to_thread(_rows, cid)
 
     if parallel:
-        cust_svc = client.get_service("CustomerService")
-        subs = [n.split("/")[-1] for n in cust_svc.list_accessible_customers().resource_names]
-        tasks = [asyncio.to_thread(_run, cid) for cid in subs]
-        res = await asyncio.gather(*tasks)
+        subs = await asyncio.to_thread(_accessible_customers, client)
+        res = await asyncio.gather(*(_run(cid) for cid in subs))
         flat: List[Dict[str, Any]] = [item for sub in res for item in sub]
         return flat
 
-    return await asyncio.to_thread(_run, customer_id)
+    return await _run(customer_id)
+
+
+async def _stream_gaql(rid: Any, customer_id: str, gaql: str):
+    """Send each search_stream batch as soon as it arrives, then a final done message"""
+    client = _client()
+    loop = asyncio.get_running_loop()
+
+    def _produce(batches: asyncio.Queue, stop: threading.Event):
+        def _put(item) -> bool:
+            # Waits in short slices so the thread gives up once the consumer has stopped reading;
+            # otherwise it would block forever on a full queue and hold an executor worker
+            if stop.is_set():
+                return False
+            future = asyncio.run_coroutine_threadsafe(batches.put(item), loop)
+            while not stop.is_set():
+                try:
+                    future.result(timeout=GAQL_STREAM_PUT_POLL)
+                    return True
+                except TimeoutError:
+                    pass
+            future.cancel()
+            return False
+
+        # At most a few batches are held in memory at a time
+        try:
+            for resp in _gaql_stream(client, customer_id, gaql):
+                if not _put([_row_dict(row) for row in resp.results]):
+                    return
+        finally:
+            _put(None)
+
+    row_count = 0
+    batch_count = 0
+    # Once a batch has been sent a retry would repeat its rows, so only failures before the first are retried
+    async for attempt in _gaql_retrying(retry=retry_if_exception(lambda e: batch_count == 0)):
+        with attempt:
+            batches: asyncio.Queue = asyncio.Queue(maxsize=GAQL_STREAM_QUEUE)
+            stop = threading.Event()
+            producer = asyncio.ensure_future(asyncio.to_thread(_produce, batches, stop))
+            try:
+                while (rows := await batches.get()) is not None:
+                    row_count += len(rows)
+                    batch_count += 1
+                    _send({"id": rid, "partial": True, "rows": rows})
+            finally:
+                # Also reached when _send fails (e.g. BrokenPipeError), so the producer stops instead of blocking
+                stop.set()
+            await producer  # Re-raises a failed stream so _dispatch reports it
+    _send({"id": rid, "done": True, "row_count": row_count})
 
 
 async def _dispatch(req):
@@ -83,10 +246,12 @@ async def _dispatch(req):
 
     try:
         if method == "lookup_docs":
-            _send({"id": rid, "result": html.escape(_doc_snippet(params["service"]))})
+            _send({"id": rid, "result": html.escape(await _doc_snippet(params["service"]))})
         elif method == "run_gaql":
             res = await _run_gaql(params["customer_id"], params["gaql"], params.get("parallel", False))
             _send({"id": rid, "result": res})
+        elif method == "run_gaql_stream":
+            await _stream_gaql(rid, params["customer_id"], params["gaql"])
         else:
             raise ValueError("unknown method")
     except GoogleAdsException as e:
@@ -99,17 +264,29 @@ async def main():
     reader = asyncio.StreamReader()
     protocol = asyncio.StreamReaderProtocol(reader)
     loop = asyncio.get_event_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=GAQL_WORKERS))
     await loop.connect_read_pipe(lambda: protocol, sys.stdin)
 
-    while True:
-        line = await reader.readline()
-        if not line:
-            break
-        try:
-            j = json.loads(line.decode())
-        except json.JSONDecodeError:
-            continue
-        await _dispatch(j)
+    # Each request runs as its own task so a slow query does not hold up the lines after it.
+    # _send writes and flushes a whole line from the loop thread, so responses never interleave.
+    pending: set[asyncio.Task] = set()
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                j = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            task = asyncio.create_task(_dispatch(j))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+    finally:
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if _SESSION is not None:
+            await _SESSION.close()
 
 if __name__ == "__main__":
     try:
@@ -7,13 +7,7 @@ Shows examples for every bidding strategy available in Google Ads API v20
 import asyncio
 import json
 from datetime import datetime
-from mcp_server import (
-    create_campaign_budget,
-    create_campaign, 
-    create_ad_group,
-    create_keywords,
-    create_responsive_search_ad
-)
+from mcp_server import create_campaign_with_budget
 
 async def test_bidding_strategies():
     """Test creating campaigns with different bidding strategies"""
@@ -69,54 +63,51 @@ async def test_bidding_strategies():
         }
     ]
     
-    successful_campaigns = []
-    
-    for i, strategy in enumerate(bidding_strategies, 1):
-        print(f"\n{i}. Testing {strategy['name']} ({strategy['type']})")
-        print(f"   {strategy['description']}")
-        
-        # Create unique budget for each strategy
-        budget_name = f"{strategy['name']} Budget {timestamp}_{i}"
-        budget_result = await create_campaign_budget(
-            customer_id=customer_id,
-            name=budget_name,
-            amount_micros=45000000,  # $45/day
-            delivery_method="STANDARD"
-        )
-        
-        if budget_result.get("error"):
-            print(f"   ❌ Budget creation failed: {budget_result['error']}")
-            continue
-            
-        budget_resource_name = budget_result["result"][0]["resourceName"]
-        print(f"   ✅ Budget created: {budget_resource_name}")
+    async def _one(i, strategy):
+        """Create one strategy's budget and campaign; returns its report lines and summary"""
+        lines = [f"\n{i}. Testing {strategy['name']} ({strategy['type']})", f"   {strategy['description']}"]
         
-        # Create campaign with specific bidding strategy
-        campaign_name = f"{strategy['name']} Campaign {timestamp}_{i}"
-        campaign_result = await create_campaign(
-            customer_id=customer_id,
-            name=campaign_name,
-            budget_resource_name=budget_resource_name,
-            bidding_strategy_type=strategy["type"],
-            target_cpa_micros=strategy.get("target_cpa_micros"),
-            target_roas=strategy.get("target_roas"),
-            geo_target_constants=["2840"],  # United States
-            status="PAUSED"
-        )
+        # Budget and campaign are created together in one atomic request
+        try:
+            result = await create_campaign_with_budget(
+                customer_id=customer_id,
+                campaign_name=f"{strategy['name']} Campaign {timestamp}_{i}",
+                amount_micros=45000000,  # $45/day
+                budget_name=f"{strategy['name']} Budget {timestamp}_{i}",
+                delivery_method="STANDARD",
+                bidding_strategy_type=strategy["type"],
+                target_cpa_micros=strategy.get("target_cpa_micros"),
+                target_roas=strategy.get("target_roas"),
+                status="PAUSED"
+            )
+        except Exception as e:
+            lines.append(f"   ❌ Unexpected error: {e}")
+            return lines, None
         
-        if campaign_result.get("error"):
-            print(f"   ❌ Campaign creation failed: {campaign_result['error']}")
-            continue
-            
-        campaign_resource_name = campaign_result["result"][0]["resourceName"]
-        print(f"   ✅ Campaign created: {campaign_resource_name}")
+        if result.get("error") or not result.get("campaign_resource_name"):
+            lines.append(f"   ❌ Budget/campaign creation failed: {result.get('error')}")
+            return lines, None
         
-        successful_campaigns.append({
+        lines.append(f"   ✅ Budget created: {result['budget_resource_name']}")
+        lines.append(f"   ✅ Campaign created: {result['campaign_resource_name']}")
+        return lines, {
             "strategy": strategy["name"],
             "type": strategy["type"],
-            "campaign": campaign_resource_name,
-            "budget": budget_resource_name
-        })
+            "campaign": result["campaign_resource_name"],
+            "budget": result["budget_resource_name"]
+        }
+    
+    # Strategies are independent, so create them all concurrently; _one reports its own
+    # failures, so the TaskGroup only cancels the rest on a bug
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_one(i, strategy)) for i, strategy in enumerate(bidding_strategies, 1)]
+    
+    successful_campaigns = []
+    for task in tasks:
+        lines, summary = task.result()
+        print("\n".join(lines))
+        if summary:
+            successful_campaigns.append(summary)
     
     print("\n" + "=" * 60)
     print("📊 SUMMARY - Successfully Created Campaigns:")
@@ -2,210 +2,296 @@
 """
 Test script for the enhanced Google Ads MCP server
 Tests the complete campaign creation workflow
+
+Progress goes through the logging module; set LOG_LEVEL=DEBUG to also see the full API responses.
+Set DRY_RUN=1 to swap every API call for a canned success and exercise only the orchestration.
 """
 
 import asyncio
-import json
+import logging
+import os
+import orjson
+from collections import namedtuple
 from datetime import datetime
+from types import SimpleNamespace
 from mcp_server import (
-    create_campaign_budget,
-    create_campaign, 
+    close_http_session,
+    create_campaign_with_budget,
     create_ad_group,
-    create_keywords,
+    create_keywords_bulk,
     create_responsive_search_ad
 )
 
+try:
+    import uvloop  # Optional: libuv-based event loop with less per-await overhead
+except ImportError:
+    uvloop = None
+
+# Ad text shared by every ad group's responsive search ad
+HEADLINES = (
+    "Find Your Perfect Business",      # 26 chars
+    "Businesses For Sale",            # 19 chars
+    "Buy A Business Today",           # 21 chars
+    "Franchise Opportunities",        # 24 chars
+    "Business Ownership Journey",     # 27 chars
+    "Available Franchises",           # 21 chars
+    "Expert Business Help",           # 21 chars
+    "Browse 1000s Businesses",        # 24 chars
+    "Explore. Compare. Own.",         # 23 chars
+    "Start Your Journey",             # 19 chars
+    "Business Listings",              # 18 chars
+    "Find Businesses",                # 16 chars
+    "Your Next Business",             # 19 chars
+    "Business Marketplace",           # 21 chars
+    "Own Your Future"                 # 15 chars
+)
+
+DESCRIPTIONS = (
+    "Explore businesses and franchises for sale. Expert guidance included.",        # 76 chars
+    "Find the perfect business opportunity. Browse by location and type.",         # 73 chars
+    "Ready to be a business owner? Discover franchises and businesses now.",       # 74 chars
+    "From automotive to retail - find your ideal business match today."           # 72 chars
+)
+
+FINAL_URLS = ("https://bizexplorer.us/",)
+
+# Checked once at import so a bad edit fails fast instead of on every ad group's request
+assert all(len(headline) <= 30 for headline in HEADLINES), "headline longer than 30 characters"
+assert all(len(description) <= 90 for description in DESCRIPTIONS), "description longer than 90 characters"
+assert len(frozenset(HEADLINES)) == len(HEADLINES), "duplicate headline"
+assert len(frozenset(DESCRIPTIONS)) == len(DESCRIPTIONS), "duplicate description"
+
+# Keyword match types, as the REST API spells them
+EXACT = "EXACT"
+PHRASE = "PHRASE"
+
+# Each ad group with its max CPC bid and keywords
+AdGroupSpec = namedtuple("AdGroupSpec", "name cpc_bid_micros keywords")
+
+AD_GROUPS = (
+    AdGroupSpec("Buy Business - Exact", 3500000, (
+        {"text": "buy a business", "match_type": EXACT},
+        {"text": "businesses for sale", "match_type": EXACT},
+        {"text": "business for sale near me", "match_type": EXACT}
+    )),
+    AdGroupSpec("Buy Franchise - Exact", 4000000, (
+        {"text": "buy a franchise", "match_type": EXACT},
+        {"text": "franchise opportunities", "match_type": EXACT},
+        {"text": "franchises for sale", "match_type": EXACT}
+    )),
+    AdGroupSpec("Business Acquisition - Phrase", 3000000, (
+        {"text": "business acquisition services", "match_type": PHRASE},
+        {"text": "acquiring a business", "match_type": PHRASE},
+        {"text": "how to buy a business", "match_type": PHRASE}
+    )),
+    AdGroupSpec("Franchise Opportunities - Phrase", 3500000, (
+        {"text": "best franchise opportunities", "match_type": PHRASE},
+        {"text": "franchise business opportunities", "match_type": PHRASE},
+        {"text": "available franchises", "match_type": PHRASE}
+    ))
+)
+
+logger = logging.getLogger(__name__)
+
+def _fake(collection: str):
+    """Stand-in for a create_* call that answers with a made-up resource name"""
+    created = 0
+    
+    async def create(customer_id, **_):
+        nonlocal created
+        created += 1
+        return {"result": [{"resourceName": f"customers/{customer_id}/{collection}/{created}"}], "error": None}
+    return create
+
+async def _fake_campaign_with_budget(customer_id, **_):
+    """Stand-in for create_campaign_with_budget"""
+    return {
+        "budget_resource_name": f"customers/{customer_id}/campaignBudgets/1",
+        "campaign_resource_name": f"customers/{customer_id}/campaigns/1",
+        "error": None
+    }
+
+async def _fake_keywords_bulk(customer_id, keyword_sets, **_):
+    """Stand-in for create_keywords_bulk, with one result per keyword like the real mutate"""
+    results = [
+        {"resourceName": f"customers/{customer_id}/adGroupCriteria/{n}"}
+        for n in range(1, sum(len(keyword_set["keywords"]) for keyword_set in keyword_sets) + 1)
+    ]
+    return {"result": results, "error": None}
+
+def _api():
+    """The create_* calls this run uses: the real ones, or canned stand-ins under DRY_RUN"""
+    if os.environ.get("DRY_RUN"):
+        return SimpleNamespace(
+            create_campaign_with_budget=_fake_campaign_with_budget,
+            create_ad_group=_fake("adGroups"),
+            create_keywords_bulk=_fake_keywords_bulk,
+            create_responsive_search_ad=_fake("adGroupAds")
+        )
+    return SimpleNamespace(
+        create_campaign_with_budget=create_campaign_with_budget,
+        create_ad_group=create_ad_group,
+        create_keywords_bulk=create_keywords_bulk,
+        create_responsive_search_ad=create_responsive_search_ad
+    )
+
+API_CONCURRENCY = 8  # Google Ads calls in flight at once; lower it if the account starts hitting 429s
+_API_SEMAPHORE = asyncio.Semaphore(API_CONCURRENCY)
+
+class _PrettyJson:
+    """Formats a response as indented JSON only when a log record actually renders it"""
+    __slots__ = ("obj",)
+    
+    def __init__(self, obj):
+        self.obj = obj
+    
+    def __str__(self):
+        return orjson.dumps(self.obj, option=orjson.OPT_INDENT_2, default=str).decode()
+
+def _extract_resource_name(result):
+    """Resource name of the first created object, or None if the response has none"""
+    try:
+        return result["result"][0]["resourceName"]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+async def _call(coro):
+    """Await one API call once a concurrency slot is free"""
+    async with _API_SEMAPHORE:
+        return await coro
+
 async def test_complete_campaign_creation():
     """Test the complete campaign creation workflow"""
     
+    # Picked per run, so the imported functions are never rebound and each dry run numbers from 1
+    api = _api()
     customer_id = "2312146774"  # BizExplorer account
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    budget_name = f"Buy Business & Franchise - Budget {timestamp}"
+    campaign_name = f"Buy Business & Franchise - Search {timestamp}"
     
-    print("🚀 Testing Complete Campaign Creation Workflow")
-    print("=" * 50)
+    logger.info("🚀 Testing Complete Campaign Creation Workflow")
+    logger.info("=" * 50)
     
-    # Step 1: Create Campaign Budget
-    print("\n1. Creating Campaign Budget...")
-    budget_result = await create_campaign_budget(
+    # Steps 1-2: the budget and the campaign using it go out as one atomic mutate,
+    # with the campaign pointing at the budget's temporary resource name
+    logger.info("\n1-2. Creating Campaign Budget and Search Campaign...")
+    campaign_result = await api.create_campaign_with_budget(
         customer_id=customer_id,
-        name=f"Buy Business & Franchise - Budget {timestamp}",
+        campaign_name=campaign_name,
         amount_micros=65000000,  # $65/day
-        delivery_method="STANDARD"
-    )
-    print(f"Budget Result: {json.dumps(budget_result, indent=2)}")
-    
-    if budget_result.get("error"):
-        print("❌ Budget creation failed, stopping test")
-        return
-    
-    budget_resource_name = budget_result.get("result", [{}])[0].get("resourceName")
-    if not budget_resource_name:
-        print("❌ No budget resource name returned, stopping test")
-        return
-    
-    print(f"✅ Budget created: {budget_resource_name}")
-    
-    # Step 2: Create Campaign
-    print("\n2. Creating Search Campaign...")
-    campaign_result = await create_campaign(
-        customer_id=customer_id,
-        name=f"Buy Business & Franchise - Search {timestamp}",
-        budget_resource_name=budget_resource_name,
+        budget_name=budget_name,
+        delivery_method="STANDARD",
         bidding_strategy_type="MANUAL_CPC",
-        geo_target_constants=["2840"],  # United States
         status="PAUSED"
     )
-    print(f"Campaign Result: {json.dumps(campaign_result, indent=2)}")
+    logger.debug("Budget/Campaign Result: %s", _PrettyJson(campaign_result))
     
     if campaign_result.get("error"):
-        print("❌ Campaign creation failed, stopping test")
+        logger.info("❌ Budget/campaign creation failed, stopping test")
         return
     
-    campaign_resource_name = campaign_result.get("result", [{}])[0].get("resourceName")
+    campaign_resource_name = campaign_result.get("campaign_resource_name")
     if not campaign_resource_name:
-        print("❌ No campaign resource name returned, stopping test")
+        logger.info("❌ No campaign resource name returned, stopping test")
         return
     
-    print(f"✅ Campaign created: {campaign_resource_name}")
-    
-    # Step 3: Create Ad Groups
-    print("\n3. Creating Ad Groups...")
+    logger.info("✅ Budget created: %s", campaign_result.get("budget_resource_name"))
+    logger.info("✅ Campaign created: %s", campaign_resource_name)
     
-    ad_groups = [
-        {"name": "Buy Business - Exact", "cpc_bid_micros": 3500000},
-        {"name": "Buy Franchise - Exact", "cpc_bid_micros": 4000000},
-        {"name": "Business Acquisition - Phrase", "cpc_bid_micros": 3000000},
-        {"name": "Franchise Opportunities - Phrase", "cpc_bid_micros": 3500000}
-    ]
+    # Step 3: an ad group's ad depends only on that ad group, so each ad group runs
+    # as its own create -> ad pipeline, all concurrently
+    logger.info("\n3. Creating Ad Groups with their Responsive Search Ads...")
     
-    ad_group_resources = []
+    # Arguments shared by every ad group's calls, built once
+    ad_group_kwargs = {
+        "customer_id": customer_id,
+        "campaign_resource_name": campaign_resource_name,
+        "status": "ENABLED"
+    }
+    ad_kwargs = {
+        "customer_id": customer_id,
+        "headlines": HEADLINES,
+        "descriptions": DESCRIPTIONS,
+        "final_urls": FINAL_URLS,
+        "path1": "buy-business",
+        "path2": "opportunities"
+    }
     
-    for ad_group in ad_groups:
-        print(f"  Creating ad group: {ad_group['name']}")
-        ag_result = await create_ad_group(
-            customer_id=customer_id,
-            campaign_resource_name=campaign_resource_name,
-            name=ad_group["name"],
-            cpc_bid_micros=ad_group["cpc_bid_micros"],
-            status="ENABLED"
-        )
+    async def provision_ad_group(ad_group):
+        """Create one ad group, then its ad; returns its report lines and resource name (None on failure)"""
+        lines = [f"\n  Creating ad group: {ad_group.name}"]
+        try:
+            ag_result = await _call(api.create_ad_group(
+                **ad_group_kwargs,
+                name=ad_group.name,
+                cpc_bid_micros=ad_group.cpc_bid_micros
+            ))
+        except Exception as e:
+            lines.append(f"❌ Ad group creation failed: {e}")
+            return lines, None
         
         if ag_result.get("error"):
-            print(f"❌ Ad group creation failed: {ag_result['error']}")
-            continue
-        
-        ag_resource_name = ag_result.get("result", [{}])[0].get("resourceName")
-        if ag_resource_name:
-            ad_group_resources.append({
-                "name": ad_group["name"],
-                "resource_name": ag_resource_name
-            })
-            print(f"✅ Ad group created: {ag_resource_name}")
-    
-    # Step 4: Create Keywords
-    print("\n4. Creating Keywords...")
-    
-    keyword_sets = [
-        {
-            "ad_group": "Buy Business - Exact",
-            "keywords": [
-                {"text": "buy a business", "match_type": "EXACT"},
-                {"text": "businesses for sale", "match_type": "EXACT"},
-                {"text": "business for sale near me", "match_type": "EXACT"}
-            ]
-        },
-        {
-            "ad_group": "Buy Franchise - Exact",
-            "keywords": [
-                {"text": "buy a franchise", "match_type": "EXACT"},
-                {"text": "franchise opportunities", "match_type": "EXACT"},
-                {"text": "franchises for sale", "match_type": "EXACT"}
-            ]
-        },
-        {
-            "ad_group": "Business Acquisition - Phrase",
-            "keywords": [
-                {"text": "business acquisition services", "match_type": "PHRASE"},
-                {"text": "acquiring a business", "match_type": "PHRASE"},
-                {"text": "how to buy a business", "match_type": "PHRASE"}
-            ]
-        },
-        {
-            "ad_group": "Franchise Opportunities - Phrase",
-            "keywords": [
-                {"text": "best franchise opportunities", "match_type": "PHRASE"},
-                {"text": "franchise business opportunities", "match_type": "PHRASE"},
-                {"text": "available franchises", "match_type": "PHRASE"}
-            ]
-        }
-    ]
-    
-    for keyword_set in keyword_sets:
-        # Find matching ad group
-        ag_resource = next((ag for ag in ad_group_resources if ag["name"] == keyword_set["ad_group"]), None)
-        if not ag_resource:
-            print(f"❌ Ad group not found: {keyword_set['ad_group']}")
-            continue
+            lines.append(f"❌ Ad group creation failed: {ag_result['error']}")
+            return lines, None
         
-        print(f"  Creating keywords for: {keyword_set['ad_group']}")
-        kw_result = await create_keywords(
-            customer_id=customer_id,
-            ad_group_resource_name=ag_resource["resource_name"],
-            keywords=keyword_set["keywords"]
-        )
+        ag_resource_name = _extract_resource_name(ag_result)
+        if not ag_resource_name:
+            lines.append("❌ No ad group resource name returned")
+            return lines, None
+        lines.append(f"✅ Ad group created: {ag_resource_name}")
         
-        if kw_result.get("error"):
-            print(f"❌ Keywords creation failed: {kw_result['error']}")
+        try:
+            ad_result = await _call(api.create_responsive_search_ad(**ad_kwargs, ad_group_resource_name=ag_resource_name))
+        except Exception as e:
+            lines.append(f"❌ Ad creation failed: {e}")
         else:
-            print(f"✅ Created {len(keyword_set['keywords'])} keywords")
-    
-    # Step 5: Create Responsive Search Ads
-    print("\n5. Creating Responsive Search Ads...")
-    
-    headlines = [
-        "Find Your Perfect Business",      # 26 chars
-        "Businesses For Sale",            # 19 chars
-        "Buy A Business Today",           # 21 chars
-        "Franchise Opportunities",        # 24 chars
-        "Business Ownership Journey",     # 27 chars
-        "Available Franchises",           # 21 chars
-        "Expert Business Help",           # 21 chars
-        "Browse 1000s Businesses",        # 24 chars
-        "Explore. Compare. Own.",         # 23 chars
-        "Start Your Journey",             # 19 chars
-        "Business Listings",              # 18 chars
-        "Find Businesses",                # 16 chars
-        "Your Next Business",             # 19 chars
-        "Business Marketplace",           # 21 chars
-        "Own Your Future"                 # 15 chars
-    ]
+            if ad_result.get("error"):
+                lines.append(f"❌ Ad creation failed: {ad_result['error']}")
+            else:
+                lines.append("✅ Responsive search ad created")
+        return lines, ag_resource_name
     
-    descriptions = [
-        "Explore businesses and franchises for sale. Expert guidance included.",        # 76 chars
-        "Find the perfect business opportunity. Browse by location and type.",         # 73 chars
-        "Ready to be a business owner? Discover franchises and businesses now.",       # 74 chars
-        "From automotive to retail - find your ideal business match today."           # 72 chars
-    ]
+    # provision_ad_group reports API failures itself, so anything escaping it is a bug:
+    # the TaskGroup then cancels the other ad groups and raises it in an ExceptionGroup
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(provision_ad_group(ad_group)) for ad_group in AD_GROUPS]
+    
+    created_ad_groups = []  # (spec, resource name) for every ad group that exists
+    for ad_group, task in zip(AD_GROUPS, tasks):
+        lines, ag_resource_name = task.result()
+        logger.info("\n".join(lines))
+        if ag_resource_name:
+            created_ad_groups.append((ad_group, ag_resource_name))
     
-    for ag_resource in ad_group_resources:
-        print(f"  Creating ad for: {ag_resource['name']}")
-        ad_result = await create_responsive_search_ad(
+    # Step 4: every ad group's keywords go out in a single mutate
+    if created_ad_groups:
+        keywords_count = sum(len(ad_group.keywords) for ad_group, _ in created_ad_groups)
+        logger.info("\n4. Creating %d Keywords across %d Ad Groups...", keywords_count, len(created_ad_groups))
+        kw_result = await api.create_keywords_bulk(
             customer_id=customer_id,
-            ad_group_resource_name=ag_resource["resource_name"],
-            headlines=headlines,
-            descriptions=descriptions,
-            final_urls=["https://bizexplorer.us/"],
-            path1="buy-business",
-            path2="opportunities"
+            keyword_sets=[
+                {"ad_group_resource_name": ag_resource_name, "keywords": ad_group.keywords}
+                for ad_group, ag_resource_name in created_ad_groups
+            ]
         )
         
-        if ad_result.get("error"):
-            print(f"❌ Ad creation failed: {ad_result['error']}")
+        if kw_result.get("error"):
+            logger.info("❌ Keywords creation failed: %s", kw_result["error"])
         else:
-            print(f"✅ Responsive search ad created")
+            logger.info("✅ Created %d of %d keywords", len(kw_result["result"]), keywords_count)
     
-    print("\n🎉 Campaign Creation Test Complete!")
-    print("=" * 50)
+    logger.info("\n🎉 Campaign Creation Test Complete!")
+    logger.info("=" * 50)
+
+async def main():
+    # Every create_* call shares mcp_server's pooled HTTP session; close it before the loop goes away
+    try:
+        await test_complete_campaign_creation()
+    finally:
+        await close_http_session()
 
 if __name__ == "__main__":
-    asyncio.run(test_complete_campaign_creation())
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+    (uvloop.run if uvloop is not None else asyncio.run)(main())
\ No newline at end of file
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test that server.py's run_gaql and run_gaql_stream return GAQL rows in the same
+format proto-plus to_json() produced: camelCase names, integer enums, default fields kept
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+from google.ads.googleads.client import GoogleAdsClient
+
+import server
+
+def _sample_row():
+    """A proto-plus GoogleAdsRow with an enum and zero-valued metrics"""
+    client = GoogleAdsClient(credentials=None, developer_token="test", use_proto_plus=True)
+    row = client.get_type("GoogleAdsRow")
+    row.campaign.id = 123
+    row.campaign.name = "Test Campaign"
+    row.campaign.status = client.enums.CampaignStatusEnum.ENABLED
+    row.metrics.clicks = 0
+    return row
+
+def _fetch_rows(pb_row):
+    """Run one query through each path against a stubbed stream; returns (run_gaql rows, run_gaql_stream rows)"""
+    sent = []
+    with mock.patch.object(server, "_client", return_value=None), \
+         mock.patch.object(server, "_gaql_stream", return_value=[SimpleNamespace(results=[pb_row])]), \
+         mock.patch.object(server, "_send", sent.append):
+        batch = asyncio.run(server._run_gaql("1234567890", "SELECT campaign.id FROM campaign"))
+        asyncio.run(server._stream_gaql(1, "1234567890", "SELECT campaign.id FROM campaign"))
+    streamed = [row for msg in sent if msg.get("partial") for row in msg["rows"]]
+    return batch, streamed
+
+def test_batch_and_stream_rows_match_proto_plus():
+    """Both paths return the row exactly as proto-plus to_json() printed it"""
+    row = _sample_row()
+    expected = json.loads(type(row).to_json(row))
+    batch, streamed = _fetch_rows(type(row).pb(row))
+    
+    assert batch == [expected]
+    assert streamed == [expected]
+    assert expected["campaign"]["status"] == 2  # Integer, not "ENABLED"
+    assert expected["metrics"]["clicks"] == "0"  # Zero-valued field kept
+
+if __name__ == "__main__":
+    test_batch_and_stream_rows_match_proto_plus()
+    print("✅ run_gaql and run_gaql_stream rows match the proto-plus format")
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Test that run_gaql hands back the customer's last proven queries when a query fails
+"""
+
+import asyncio
+from unittest import mock
+
+import mcp_server
+
+def test_failed_query_returns_recent_successful_queries():
+    """A failing query's result carries the customer's recent successful GAQL"""
+    customer_id = "1234567890"
+    proven_query = "SELECT campaign.id, campaign.name FROM campaign"
+    mcp_server.api_logger._remember([{
+        "query": proven_query,
+        "customer_id": customer_id,
+        "result_count": 3,
+        "operation_type": "gaql_query"
+    }])
+    
+    async def failing_request(*args, **kwargs):
+        return {"error": "API request failed: 400, message='Bad Request'"}
+    
+    with mock.patch.object(mcp_server, "make_google_ads_request", failing_request):
+        result = asyncio.run(mcp_server.run_gaql(customer_id, "SELECT campaign.bogus FROM campaign"))
+    
+    assert result["error"]
+    assert result["recent_successful_queries"] == [proven_query]
+
+if __name__ == "__main__":
+    test_failed_query_returns_recent_successful_queries()
+    print("✅ Failed run_gaql queries return recent_successful_queries")